@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the Open Meteo Marine integration.
+Measures the fetch -> parse -> entity-update pipeline against a local
+stand-in for the API and writes machine-readable results.
+
+Requires the development dependencies (pytest-homeassistant-custom-component).
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+from homeassistant.const import CONF_LATITUDE, CONF_LONGITUDE, EVENT_STATE_CHANGED
+from homeassistant.setup import async_setup_component
+from homeassistant import loader
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_test_home_assistant,
+)
+
+from custom_components.openmeteo_marine.const import (
+    CONF_FORECAST_DAYS,
+    CONF_GRID_MODE,
+    CONF_UNIXTIME,
+    CONF_UPDATE_INTERVAL,
+    CURRENT_VARIABLES,
+    DOMAIN,
+)
+from custom_components.openmeteo_marine.parser import (
+    json_loads,
+    parse_current,
+    parse_hourly,
+    response_timezone,
+)
+from custom_components.openmeteo_marine.transport import (
+    ReplayTransport,
+    synthesize_response,
+)
+from script_helpers import percentile
+
+MANIFEST = Path(__file__).parent / "custom_components" / DOMAIN / "manifest.json"
+
+# Imported first so only the integration's own import cost is measured
+IMPORT_PRELUDE = (
+    "import homeassistant.core, homeassistant.config_entries, "
+    "homeassistant.helpers.config_validation, homeassistant.helpers.update_coordinator, "
+    "homeassistant.helpers.discovery"
+)
+
+
+def summarize(samples: list[float]) -> dict:
+    """Return latency statistics in milliseconds."""
+    millis = [sample * 1000 for sample in samples]
+    return {
+        "p50_ms": round(percentile(millis, 0.50), 3),
+        "p95_ms": round(percentile(millis, 0.95), 3),
+        "mean_ms": round(statistics.fmean(millis), 3),
+        "samples": len(millis),
+    }
+
+
+def entry_locations(count: int) -> list[tuple[float, float]]:
+    """Return distinct coordinates along a stretch of coast."""
+    return [(round(-33.0 - index * 0.05, 4), round(151.3 + index * 0.01, 4)) for index in range(count)]
+
+
+async def bench_entries(count: int, rounds: int, latency: float, options: dict) -> dict:
+    """Measure setup, refresh latency, memory and state writes for N entries."""
+    async with async_test_home_assistant() as hass:
+        hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+        transport = ReplayTransport(synthesize=True, latency=latency)
+        hass.data[DOMAIN] = {"transport": transport}
+
+        entries = []
+        for latitude, longitude in entry_locations(count):
+            entry = MockConfigEntry(
+                domain=DOMAIN,
+                data={
+                    CONF_LATITUDE: latitude,
+                    CONF_LONGITUDE: longitude,
+                    CONF_UPDATE_INTERVAL: 60,
+                    **options,
+                },
+                unique_id=f"{latitude}_{longitude}",
+            )
+            entry.add_to_hass(hass)
+            entries.append(entry)
+
+        tracemalloc.start()
+        memory_before = tracemalloc.get_traced_memory()[0]
+        started = time.perf_counter()
+        # Setting up the component sets up every entry added above
+        await async_setup_component(hass, DOMAIN, {})
+        await hass.async_block_till_done()
+        setup_seconds = time.perf_counter() - started
+        memory_after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        coordinators = [hass.data[DOMAIN][entry.entry_id] for entry in entries]
+
+        state_writes = 0
+
+        def count_write(event):
+            nonlocal state_writes
+            state_writes += 1
+
+        unsubscribe = hass.bus.async_listen(EVENT_STATE_CHANGED, count_write)
+        requests_before = transport.requests
+        refresh_samples = []
+        for _ in range(rounds):
+            for coordinator in coordinators:
+                started = time.perf_counter()
+                await coordinator.async_refresh()
+                refresh_samples.append(time.perf_counter() - started)
+            await hass.async_block_till_done()
+        unsubscribe()
+        api_requests = transport.requests - requests_before
+
+        for entry in entries:
+            await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+        await hass.async_stop(force=True)
+
+    return {
+        "setup_ms": round(setup_seconds * 1000, 3),
+        "setup_per_entry_ms": round(setup_seconds * 1000 / count, 3),
+        "refresh": summarize(refresh_samples),
+        "memory_per_entry_bytes": (memory_after - memory_before) // count,
+        "state_writes_per_refresh": round(state_writes / (rounds * count), 2),
+        "api_requests_per_refresh": round(api_requests / (rounds * count), 2),
+    }
+
+
+def time_samples(func, body: bytes, iterations: int) -> dict:
+    """Time a decode-and-parse function over one payload."""
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        func(body)
+        samples.append(time.perf_counter() - started)
+    return {**summarize(samples), "bytes": len(body)}
+
+
+def bench_parse(iterations: int) -> dict:
+    """Measure decode and parse time for current and hourly payloads."""
+    location = {"latitude": -33.89, "longitude": 151.27}
+    current_body = synthesize_response({**location, "current": CURRENT_VARIABLES})
+    hourly = {**location, "hourly": CURRENT_VARIABLES, "forecast_days": 7}
+    hourly_iso_body = synthesize_response(hourly)
+    hourly_unix_body = synthesize_response({**hourly, "timeformat": "unixtime"})
+
+    def parse_hourly_body(body: bytes) -> None:
+        data = json_loads(body)
+        parse_hourly(data["hourly"], response_timezone(data))
+
+    return {
+        "current": time_samples(
+            lambda body: parse_current(json_loads(body)["current"]), current_body, iterations
+        ),
+        "hourly_iso": time_samples(parse_hourly_body, hourly_iso_body, iterations),
+        "hourly_unixtime": time_samples(parse_hourly_body, hourly_unix_body, iterations),
+    }
+
+
+def bench_import(iterations: int, root: Path = Path(__file__).parent) -> dict:
+    """Measure the cost of loading the integration in fresh interpreters."""
+    package = f"custom_components.{DOMAIN}"
+    code = f"{IMPORT_PRELUDE}\nimport {package}\nimport sys\nprint('httpx' in sys.modules)"
+    samples = []
+    for _ in range(iterations):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            check=True,
+            cwd=root,
+            text=True,
+        )
+        # -X importtime lines are "import time: self | cumulative | module"
+        for line in result.stderr.splitlines():
+            fields = [field.strip() for field in line.split("|")]
+            if len(fields) == 3 and fields[2] == package:
+                samples.append(int(fields[1]) / 1_000_000)
+    return {**summarize(samples), "httpx_loaded": result.stdout.strip() == "True"}
+
+
+def bench_import_at(ref: str, iterations: int) -> dict:
+    """Measure the import cost of the integration as of a git revision."""
+    root = Path(__file__).parent
+    archive = subprocess.run(
+        ["git", "archive", ref, "custom_components"],
+        capture_output=True,
+        check=True,
+        cwd=root,
+    ).stdout
+    with tempfile.TemporaryDirectory() as checkout:
+        with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+            tar.extractall(checkout)
+        return {**bench_import(iterations, Path(checkout)), "ref": ref}
+
+
+def compare(results: dict, baseline: dict) -> None:
+    """Print the change of every timing against a previous run."""
+    def flatten(data, prefix=""):
+        for key, value in data.items():
+            if isinstance(value, dict):
+                yield from flatten(value, f"{prefix}{key}.")
+            elif key != "samples" and isinstance(value, (int, float)) and not isinstance(value, bool):
+                yield f"{prefix}{key}", value
+
+    print("\n📊 Compared with baseline")
+    base = dict(flatten(baseline.get("results", {})))
+    for key, value in flatten(results["results"]):
+        if key in base and base[key]:
+            change = (value - base[key]) / base[key] * 100
+            marker = "🔺" if change > 10 else "🔻" if change < -10 else "  "
+            print(f"{marker} {key}: {base[key]} -> {value} ({change:+.1f}%)")
+
+
+async def run(args) -> dict:
+    """Run every benchmark."""
+    manifest = json.loads(MANIFEST.read_text(encoding="utf-8"))
+    options = {
+        CONF_GRID_MODE: args.grid,
+        CONF_FORECAST_DAYS: args.forecast_days,
+        CONF_UNIXTIME: args.unixtime,
+    }
+    results = {
+        "import": bench_import(args.import_iterations),
+        "entries": {},
+        "parse": bench_parse(args.parse_iterations),
+    }
+    if args.import_baseline:
+        results["import_baseline"] = bench_import_at(args.import_baseline, args.import_iterations)
+    # Pay the one-time import and platform load cost before measuring, so the
+    # first size is comparable with the others
+    print("🔥 Warming up...")
+    await bench_entries(1, 1, 0.0, options)
+    for count in args.entries:
+        print(f"⏱️ Benchmarking {count} entries...")
+        results["entries"][str(count)] = await bench_entries(
+            count, args.rounds, args.latency / 1000, options
+        )
+
+    return {
+        "version": manifest["version"],
+        "python": platform.python_version(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "latency_ms": args.latency,
+        "options": options,
+        "results": results,
+    }
+
+
+def main():
+    """Parse arguments, run the suite and write the results."""
+    parser = argparse.ArgumentParser(description="Benchmark the Open Meteo Marine integration")
+    parser.add_argument("--entries", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--rounds", type=int, default=5, help="Refreshes per coordinator")
+    parser.add_argument("--parse-iterations", type=int, default=200)
+    parser.add_argument("--import-iterations", type=int, default=5, help="Fresh interpreters timing the import")
+    parser.add_argument("--import-baseline", metavar="REF", help="Also time the import as of this git revision")
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated API latency (ms)")
+    parser.add_argument("--grid", action="store_true", help="Set up entries in grid mode")
+    parser.add_argument("--forecast-days", type=int, default=0, help="Hourly forecast days per entry")
+    parser.add_argument("--unixtime", action="store_true", help="Request unixtime timestamps")
+    parser.add_argument("--output", help="Write JSON results to this file")
+    parser.add_argument("--compare", help="Previous JSON results to compare against")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    output = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+        print(f"💾 Results written to {args.output}")
+    else:
+        print(output)
+
+    if args.compare:
+        compare(results, json.loads(Path(args.compare).read_text(encoding="utf-8")))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import logging
 from datetime import timedelta
+from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
@@ -11,32 +12,190 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.discovery import async_load_platform
 
-from .const import DOMAIN, DEFAULT_UPDATE_INTERVAL, CONF_UPDATE_INTERVAL
-from .coordinator import OpenMeteoMarineDataUpdateCoordinator
+from .const import (
+    DOMAIN,
+    API_BASE_URL,
+    DEFAULT_UPDATE_INTERVAL,
+    DEFAULT_GRID_MODE,
+    DEFAULT_FORECAST_DAYS,
+    DEFAULT_UNIXTIME,
+    DEFAULT_MODELS,
+    DEFAULT_PRIORITY,
+    MARINE_MODELS,
+    PRIORITY_WEIGHTS,
+    MAX_FORECAST_DAYS,
+    CONF_UPDATE_INTERVAL,
+    CONF_GRID_MODE,
+    CONF_FORECAST_DAYS,
+    CONF_UNIXTIME,
+    CONF_MODELS,
+    CONF_PRIORITY,
+)
+from .forecast import async_register_forecast_services
+from .profiling import async_register_profiling_services
+
+if TYPE_CHECKING:
+    from .coordinator import OpenMeteoMarineDataUpdateCoordinator
+    from .grid import MarineGrid
+    from .scheduler import MarineScheduler
+    from .transport import MarineTransport
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.SENSOR]
+PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.WEATHER]
+
+
+def _no_forecast_in_grid_mode(config: dict[str, Any]) -> dict[str, Any]:
+    """Reject forecast days for grid locations, which only get current data."""
+    if config[CONF_GRID_MODE] and config[CONF_FORECAST_DAYS]:
+        raise vol.Invalid(f"{CONF_FORECAST_DAYS} is not supported in {CONF_GRID_MODE}")
+    return config
+
 
 # YAML Configuration Schema
 CONFIG_SCHEMA = vol.Schema(
     {
-        DOMAIN: vol.Schema(
-            {
-                vol.Required(CONF_LATITUDE): cv.latitude,
-                vol.Required(CONF_LONGITUDE): cv.longitude,
-                vol.Optional(CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL): vol.All(
-                    vol.Coerce(int), vol.Range(min=15, max=1440)
-                ),
-            }
+        DOMAIN: vol.All(
+            vol.Schema(
+                {
+                    vol.Required(CONF_LATITUDE): cv.latitude,
+                    vol.Required(CONF_LONGITUDE): cv.longitude,
+                    vol.Optional(CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL): vol.All(
+                        vol.Coerce(int), vol.Range(min=15, max=1440)
+                    ),
+                    vol.Optional(CONF_GRID_MODE, default=DEFAULT_GRID_MODE): cv.boolean,
+                    vol.Optional(CONF_FORECAST_DAYS, default=DEFAULT_FORECAST_DAYS): vol.All(
+                        vol.Coerce(int), vol.Range(min=0, max=MAX_FORECAST_DAYS)
+                    ),
+                    vol.Optional(CONF_UNIXTIME, default=DEFAULT_UNIXTIME): cv.boolean,
+                    vol.Optional(CONF_MODELS, default=DEFAULT_MODELS): vol.All(
+                        cv.ensure_list, [vol.In(MARINE_MODELS)]
+                    ),
+                    vol.Optional(CONF_PRIORITY, default=DEFAULT_PRIORITY): vol.In(
+                        list(PRIORITY_WEIGHTS)
+                    ),
+                }
+            ),
+            _no_forecast_in_grid_mode,
         )
     },
     extra=vol.ALLOW_EXTRA,
 )
 
 
+def _async_get_transport(hass: HomeAssistant) -> MarineTransport:
+    """Return the transport shared by all coordinators and the grid.
+
+    Benchmarks and offline runs store a replay transport under
+    ``hass.data[DOMAIN]["transport"]`` before setting up entries; otherwise
+    the live API is reached through Home Assistant's shared httpx client,
+    so no HTTP client of our own is created or imported at startup.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if "transport" not in domain_data:
+        from homeassistant.helpers.httpx_client import get_async_client
+
+        from .transport import HttpxTransport
+
+        domain_data["transport"] = HttpxTransport(
+            API_BASE_URL, client=get_async_client(hass)
+        )
+    return domain_data["transport"]
+
+
+def _async_get_grid(hass: HomeAssistant, config: dict) -> MarineGrid | None:
+    """Return the shared grid if the location is served by it."""
+    if not config.get(CONF_GRID_MODE, DEFAULT_GRID_MODE):
+        return None
+
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if "grid" not in domain_data:
+        from .grid import MarineGrid
+
+        domain_data["grid"] = MarineGrid(transport=_async_get_transport(hass))
+
+    grid = domain_data["grid"]
+    grid.register(config[CONF_LATITUDE], config[CONF_LONGITUDE])
+    return grid
+
+
+async def _async_release_grid(
+    hass: HomeAssistant, coordinator: OpenMeteoMarineDataUpdateCoordinator
+) -> None:
+    """Stop serving a location from the shared grid."""
+    grid = coordinator.grid
+    if grid is None:
+        return
+
+    grid.unregister(coordinator.latitude, coordinator.longitude)
+    if grid.empty:
+        hass.data[DOMAIN].pop("grid", None)
+        await grid.async_close()
+
+
+def _async_get_scheduler(hass: HomeAssistant) -> MarineScheduler:
+    """Return the scheduler that owns every location's refreshes."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if "scheduler" not in domain_data:
+        from .scheduler import MarineScheduler
+
+        domain_data["scheduler"] = MarineScheduler(hass, _async_get_transport(hass))
+    return domain_data["scheduler"]
+
+
+def _async_release_scheduler(
+    hass: HomeAssistant, coordinator: OpenMeteoMarineDataUpdateCoordinator
+) -> None:
+    """Stop scheduling a location's refreshes."""
+    scheduler = _async_get_scheduler(hass)
+    scheduler.unregister(coordinator)
+    if scheduler.empty:
+        hass.data[DOMAIN].pop("scheduler", None)
+
+
+async def _async_first_refresh(
+    hass: HomeAssistant, coordinator: OpenMeteoMarineDataUpdateCoordinator
+) -> None:
+    """Run the first refresh, releasing the grid location if it fails.
+
+    Setup is retried with a new coordinator, which registers the location
+    again; without the release every retry would leave a stale reference.
+    """
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        await _async_release_grid(hass, coordinator)
+        raise
+
+
+def _create_coordinator(
+    hass: HomeAssistant, config: dict[str, Any]
+) -> OpenMeteoMarineDataUpdateCoordinator:
+    """Create a coordinator for one location.
+
+    The coordinator module pulls in the network, parsing and statistics
+    code, so it is imported here rather than when the integration loads;
+    an install without any location never imports it.
+    """
+    from .coordinator import OpenMeteoMarineDataUpdateCoordinator
+
+    return OpenMeteoMarineDataUpdateCoordinator(
+        hass,
+        config,
+        update_interval=timedelta(
+            minutes=config.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
+        ),
+        grid=_async_get_grid(hass, config),
+        transport=_async_get_transport(hass),
+        scheduled=True,
+    )
+
+
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up Open Meteo Marine from YAML configuration."""
+    async_register_forecast_services(hass)
+    async_register_profiling_services(hass)
+
     if DOMAIN not in config:
         return True
 
@@ -44,23 +203,29 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     
     _LOGGER.info("Setting up Open Meteo Marine integration from YAML")
     
-    coordinator = OpenMeteoMarineDataUpdateCoordinator(
+    coordinator = _create_coordinator(
         hass,
         {
             CONF_LATITUDE: conf[CONF_LATITUDE],
             CONF_LONGITUDE: conf[CONF_LONGITUDE],
             CONF_UPDATE_INTERVAL: conf[CONF_UPDATE_INTERVAL],
+            CONF_GRID_MODE: conf[CONF_GRID_MODE],
+            CONF_FORECAST_DAYS: conf[CONF_FORECAST_DAYS],
+            CONF_UNIXTIME: conf[CONF_UNIXTIME],
+            CONF_MODELS: conf[CONF_MODELS],
+            CONF_PRIORITY: conf[CONF_PRIORITY],
         },
-        update_interval=timedelta(minutes=conf[CONF_UPDATE_INTERVAL])
     )
 
-    await coordinator.async_config_entry_first_refresh()
+    await _async_first_refresh(hass, coordinator)
+    _async_get_scheduler(hass).register(coordinator)
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN]["yaml_config"] = coordinator
 
-    # Load sensor platform
-    await async_load_platform(hass, Platform.SENSOR, DOMAIN, {}, config)
+    # Load sensor and weather platforms
+    for platform in PLATFORMS:
+        await async_load_platform(hass, platform, DOMAIN, {}, config)
 
     return True
 
@@ -69,13 +234,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Open Meteo Marine from a config entry."""
     _LOGGER.info("Setting up Open Meteo Marine integration from UI")
     
-    coordinator = OpenMeteoMarineDataUpdateCoordinator(
-        hass,
-        entry.data,
-        update_interval=timedelta(minutes=entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL))
-    )
+    coordinator = _create_coordinator(hass, entry.data)
 
-    await coordinator.async_config_entry_first_refresh()
+    await _async_first_refresh(hass, coordinator)
+    _async_get_scheduler(hass).register(coordinator)
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
@@ -88,6 +250,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        _async_release_scheduler(hass, coordinator)
+        await _async_release_grid(hass, coordinator)
 
     return unload_ok
\ No newline at end of file
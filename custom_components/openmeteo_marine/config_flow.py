@@ -12,7 +12,23 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 
-from .const import DOMAIN, CONF_UPDATE_INTERVAL
+from .const import (
+    DOMAIN,
+    CONF_UPDATE_INTERVAL,
+    CONF_GRID_MODE,
+    CONF_FORECAST_DAYS,
+    CONF_UNIXTIME,
+    CONF_MODELS,
+    CONF_PRIORITY,
+    DEFAULT_GRID_MODE,
+    DEFAULT_FORECAST_DAYS,
+    DEFAULT_UNIXTIME,
+    DEFAULT_MODELS,
+    DEFAULT_PRIORITY,
+    MARINE_MODELS,
+    PRIORITY_WEIGHTS,
+    MAX_FORECAST_DAYS,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,6 +39,13 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
         vol.Optional(CONF_UPDATE_INTERVAL, default=60): vol.All(
             vol.Coerce(int), vol.Range(min=15, max=1440)
         ),
+        vol.Optional(CONF_GRID_MODE, default=DEFAULT_GRID_MODE): bool,
+        vol.Optional(CONF_FORECAST_DAYS, default=DEFAULT_FORECAST_DAYS): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=MAX_FORECAST_DAYS)
+        ),
+        vol.Optional(CONF_UNIXTIME, default=DEFAULT_UNIXTIME): bool,
+        vol.Optional(CONF_MODELS, default=DEFAULT_MODELS): cv.multi_select(MARINE_MODELS),
+        vol.Optional(CONF_PRIORITY, default=DEFAULT_PRIORITY): vol.In(list(PRIORITY_WEIGHTS)),
     }
 )
 
@@ -39,6 +62,10 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     if not (-180 <= longitude <= 180):
         raise InvalidLongitude
 
+    # Grid locations are interpolated from current conditions only
+    if data.get(CONF_GRID_MODE) and data.get(CONF_FORECAST_DAYS):
+        raise GridModeForecast
+
     # Return info that you want to store in the config entry.
     return {"title": f"Open Meteo Marine ({latitude}, {longitude})"}
 
@@ -60,7 +87,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Handle the initial step."""
         if user_input is None:
             return self.async_show_form(
-                step_id="user", data_schema=STEP_USER_DATA_SCHEMA
+                step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors={}
             )
 
         errors = {}
@@ -71,6 +98,8 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors["base"] = "invalid_latitude"
         except InvalidLongitude:
             errors["base"] = "invalid_longitude"
+        except GridModeForecast:
+            errors["base"] = "grid_mode_forecast"
         except Exception:  # pylint: disable=broad-except
             _LOGGER.exception("Unexpected exception")
             errors["base"] = "unknown"
@@ -121,4 +150,8 @@ class InvalidLatitude(HomeAssistantError):
 
 
 class InvalidLongitude(HomeAssistantError):
-    """Error to indicate there is invalid longitude."""
\ No newline at end of file
+    """Error to indicate there is invalid longitude."""
+
+
+class GridModeForecast(HomeAssistantError):
+    """Error to indicate forecast days were requested in grid mode."""
\ No newline at end of file
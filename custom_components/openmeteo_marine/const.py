@@ -1,14 +1,58 @@
 """Constants for the Open Meteo Marine integration."""
 
-from homeassistant.const import CONF_LATITUDE, CONF_LONGITUDE
-
 DOMAIN = "openmeteo_marine"
 ATTRIBUTION = "Data provided by Open-Meteo Marine API"
 
 # Configuration
 CONF_UPDATE_INTERVAL = "update_interval"
+CONF_GRID_MODE = "grid_mode"
+CONF_FORECAST_DAYS = "forecast_days"
+CONF_UNIXTIME = "unixtime"
+CONF_MODELS = "models"
+CONF_PRIORITY = "priority"
 
 DEFAULT_UPDATE_INTERVAL = 60  # minutes
+DEFAULT_GRID_MODE = False
+DEFAULT_FORECAST_DAYS = 0  # current conditions only
+DEFAULT_UNIXTIME = False
+DEFAULT_MODELS: list[str] = []  # the API's best match
+DEFAULT_PRIORITY = "normal"
+MAX_FORECAST_DAYS = 16
+
+# Shared grid interpolation
+GRID_RESOLUTION = 0.25  # degrees between fetched grid points
+GRID_MAX_LOCATIONS_PER_REQUEST = 50
+GRID_SNAPSHOT_MAX_AGE = 5  # minutes a fetched grid is reused across entries
+
+# Central refresh scheduler
+PRIORITY_WEIGHTS = {"low": 0.5, "normal": 1.0, "high": 2.0}
+SCHEDULER_TICK = 60  # seconds between scheduling rounds
+SCHEDULER_REQUEST_BUDGET = 120  # API requests per hour shared by all locations
+SCHEDULER_BURST = 10  # requests that can be spent at once after a quiet spell
+SCHEDULER_RIDE_ALONG = 0.5  # score needed to fill a spare slot in an outgoing batch
+SCHEDULER_VIEW_WINDOW = 30  # minutes a read keeps boosting a location
+SCHEDULER_VOLATILITY_SCALE = 0.25  # wave height trend (m/h) that doubles urgency
+SCHEDULER_MIN_INTERVAL = 15  # minutes a location always waits between fetches
+SCHEDULER_RETRY = 60  # seconds before retrying a failed location, doubled per failure
+
+# Wave models that can be compared in a single request
+MARINE_MODELS = [
+    "ecmwf_wam025",
+    "ncep_gfswave025",
+    "meteofrance_wave",
+    "ewam",
+    "gwam",
+]
+
+# Forecast service
+SERVICE_GET_FORECAST = "get_forecast"
+
+# Profiling services
+SERVICE_START_PROFILE = "start_profile"
+SERVICE_STOP_PROFILE = "stop_profile"
+SERVICE_SET_TIMING = "set_timing"
+DEFAULT_PROFILE_DURATION = 60  # seconds
+MAX_PROFILE_DURATION = 3600  # seconds
 
 # API endpoints
 API_BASE_URL = "https://marine-api.open-meteo.com/v1/marine"
@@ -63,4 +107,171 @@ SENSOR_TYPES = {
         "icon": "mdi:compass-outline",
         "api_param": "ocean_current_direction",
     },
+}
+
+# API variables requested for the "current" block
+CURRENT_VARIABLES = [config["api_param"] for config in SENSOR_TYPES.values()]
+
+# API variables holding compass directions, averaged on the unit circle
+DIRECTIONAL_VARIABLES = {"wave_direction", "ocean_current_direction"}
+DIRECTIONAL_SENSOR_TYPES = {
+    sensor_type
+    for sensor_type, config in SENSOR_TYPES.items()
+    if config["api_param"] in DIRECTIONAL_VARIABLES
+}
+
+# Rolling history kept per location
+HISTORY_SIZE = 48  # snapshots, two days at the default interval
+
+# Sensors computed incrementally from the rolling history
+HISTORY_SENSOR_TYPES = {
+    "wave_height_trend": {
+        "name": "Wave Height Trend",
+        "source": "wave_height",
+        "statistic": "trend",
+        "native_unit_of_measurement": "m/h",
+        "device_class": None,
+        "state_class": "measurement",
+        "icon": "mdi:chart-line",
+    },
+    "wave_height_rate_of_change": {
+        "name": "Wave Height Rate of Change",
+        "source": "wave_height",
+        "statistic": "rate_of_change",
+        "native_unit_of_measurement": "m/h",
+        "device_class": None,
+        "state_class": "measurement",
+        "icon": "mdi:delta",
+    },
+    "wave_height_rolling_min": {
+        "name": "Wave Height Rolling Min",
+        "source": "wave_height",
+        "statistic": "minimum",
+        "native_unit_of_measurement": "m",
+        "device_class": None,
+        "state_class": "measurement",
+        "icon": "mdi:arrow-collapse-down",
+    },
+    "wave_height_rolling_max": {
+        "name": "Wave Height Rolling Max",
+        "source": "wave_height",
+        "statistic": "maximum",
+        "native_unit_of_measurement": "m",
+        "device_class": None,
+        "state_class": "measurement",
+        "icon": "mdi:arrow-collapse-up",
+    },
+    "wave_period_trend": {
+        "name": "Wave Period Trend",
+        "source": "wave_period",
+        "statistic": "trend",
+        "native_unit_of_measurement": "s/h",
+        "device_class": None,
+        "state_class": "measurement",
+        "icon": "mdi:chart-line",
+    },
+    "sea_surface_temperature_trend": {
+        "name": "Sea Surface Temperature Trend",
+        "source": "sea_surface_temperature",
+        "statistic": "trend",
+        "native_unit_of_measurement": "°C/h",
+        "device_class": None,
+        "state_class": "measurement",
+        "icon": "mdi:chart-line",
+    },
+    "sea_surface_temperature_rolling_min": {
+        "name": "Sea Surface Temperature Rolling Min",
+        "source": "sea_surface_temperature",
+        "statistic": "minimum",
+        "native_unit_of_measurement": "°C",
+        "device_class": "temperature",
+        "state_class": "measurement",
+        "icon": "mdi:thermometer-low",
+    },
+    "sea_surface_temperature_rolling_max": {
+        "name": "Sea Surface Temperature Rolling Max",
+        "source": "sea_surface_temperature",
+        "statistic": "maximum",
+        "native_unit_of_measurement": "°C",
+        "device_class": "temperature",
+        "state_class": "measurement",
+        "icon": "mdi:thermometer-high",
+    },
+}
+
+HISTORY_VARIABLES = sorted({config["source"] for config in HISTORY_SENSOR_TYPES.values()})
+# Sensors summarizing the hourly forecast per local day; the state is
+# today's value and the following days are exposed as an attribute
+SUMMARY_SENSOR_TYPES = {
+    "wave_height_daily_max": {
+        "name": "Wave Height Max Today",
+        "source": "wave_height_max",
+        "native_unit_of_measurement": "m",
+        "device_class": None,
+        "state_class": None,
+        "icon": "mdi:wave",
+    },
+    "wave_height_daily_mean": {
+        "name": "Wave Height Mean Today",
+        "source": "wave_height_mean",
+        "native_unit_of_measurement": "m",
+        "device_class": None,
+        "state_class": None,
+        "icon": "mdi:wave",
+    },
+    "wave_direction_daily_dominant": {
+        "name": "Wave Direction Dominant Today",
+        "source": "wave_direction_mean",
+        "native_unit_of_measurement": "°",
+        "device_class": None,
+        "state_class": None,
+        "icon": "mdi:compass",
+    },
+    "sea_surface_temperature_daily_min": {
+        "name": "Sea Surface Temperature Min Today",
+        "source": "sea_surface_temperature_min",
+        "native_unit_of_measurement": "°C",
+        "device_class": "temperature",
+        "state_class": None,
+        "icon": "mdi:thermometer-low",
+    },
+    "sea_surface_temperature_daily_max": {
+        "name": "Sea Surface Temperature Max Today",
+        "source": "sea_surface_temperature_max",
+        "native_unit_of_measurement": "°C",
+        "device_class": "temperature",
+        "state_class": None,
+        "icon": "mdi:thermometer-high",
+    },
+}
+
+# Sensors comparing the requested models, added when two or more are set
+ENSEMBLE_SENSOR_TYPES = {
+    "model_confidence": {
+        "name": "Model Confidence",
+        "source": None,
+        "statistic": "confidence",
+        "native_unit_of_measurement": "%",
+        "device_class": None,
+        "state_class": "measurement",
+        "icon": "mdi:check-decagram",
+    },
+    "wave_height_model_spread": {
+        "name": "Wave Height Model Spread",
+        "source": "wave_height",
+        "statistic": "spread",
+        "native_unit_of_measurement": "m",
+        "device_class": None,
+        "state_class": "measurement",
+        "icon": "mdi:arrow-expand-vertical",
+    },
+    "wave_period_model_spread": {
+        "name": "Wave Period Model Spread",
+        "source": "wave_period",
+        "statistic": "spread",
+        "native_unit_of_measurement": "s",
+        "device_class": None,
+        "state_class": "measurement",
+        "icon": "mdi:arrow-expand-vertical",
+    },
 }
\ No newline at end of file
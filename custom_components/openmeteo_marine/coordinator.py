@@ -2,19 +2,66 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, tzinfo
 from typing import Any
 
-import httpx
 from homeassistant.const import CONF_LATITUDE, CONF_LONGITUDE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.httpx_client import get_async_client
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, API_BASE_URL, ATTRIBUTION
+from .const import (
+    DOMAIN,
+    API_BASE_URL,
+    ATTRIBUTION,
+    CONF_FORECAST_DAYS,
+    CONF_MODELS,
+    CONF_PRIORITY,
+    CONF_UNIXTIME,
+    CURRENT_VARIABLES,
+    DIRECTIONAL_SENSOR_TYPES,
+    DIRECTIONAL_VARIABLES,
+    DEFAULT_FORECAST_DAYS,
+    DEFAULT_MODELS,
+    DEFAULT_PRIORITY,
+    DEFAULT_UNIXTIME,
+    GRID_SNAPSHOT_MAX_AGE,
+    HISTORY_SIZE,
+    HISTORY_VARIABLES,
+    SENSOR_TYPES,
+)
+from .ensemble import confidence, merge_current, merge_hourly
+from .grid import MarineGrid
+from .history import MarineHistory
+from .parser import (
+    MarineColumns,
+    json_loads,
+    parse_current,
+    parse_hourly,
+    parse_timestamp,
+    response_timezone,
+)
+from .profiling import async_get_profiler
+from .summary import daily_aggregates
+from .transport import HttpxTransport, MarineTransport, MarineTransportError
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@callback
+def async_get_coordinators(
+    hass: HomeAssistant,
+) -> dict[str, OpenMeteoMarineDataUpdateCoordinator]:
+    """Return all coordinators keyed by config entry id (or "yaml_config")."""
+    return {
+        key: value
+        for key, value in hass.data.get(DOMAIN, {}).items()
+        if isinstance(value, OpenMeteoMarineDataUpdateCoordinator)
+    }
+
+
 class OpenMeteoMarineDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the Open Meteo Marine API."""
 
@@ -23,86 +70,216 @@ class OpenMeteoMarineDataUpdateCoordinator(DataUpdateCoordinator):
         hass: HomeAssistant,
         config: dict[str, Any],
         update_interval: timedelta,
+        grid: MarineGrid | None = None,
+        transport: MarineTransport | None = None,
+        scheduled: bool = False,
     ) -> None:
-        """Initialize."""
+        """Initialize.
+
+        A scheduled coordinator has no timer of its own: the central
+        scheduler refreshes it, using update_interval as its base interval.
+        """
         self.latitude = config[CONF_LATITUDE]
         self.longitude = config[CONF_LONGITUDE]
-        self._client = httpx.AsyncClient(timeout=30.0)
+        # Grid locations only get current conditions, see _fetch_grid_data
+        self.forecast_days = (
+            0 if grid is not None else config.get(CONF_FORECAST_DAYS, DEFAULT_FORECAST_DAYS)
+        )
+        self.unixtime = config.get(CONF_UNIXTIME, DEFAULT_UNIXTIME)
+        self.models = list(config.get(CONF_MODELS, DEFAULT_MODELS))
+        self.priority = config.get(CONF_PRIORITY, DEFAULT_PRIORITY)
+        self.refresh_interval = update_interval
+        self.grid = grid
+        self.profiler = async_get_profiler(hass)
+        self.history = MarineHistory(HISTORY_VARIABLES, HISTORY_SIZE)
+        self._hourly: MarineColumns | None = None
+        self._daily: list[dict[str, Any]] = []
+        # Bumped whenever the hourly forecast changes, so entities can tell
+        # a new forecast from a refresh that returned the same one
+        self.forecast_revision = 0
+        # Monotonic times read by the scheduler
+        self.last_fetch: float | None = None
+        self.last_attempt: float | None = None
+        self.last_viewed: float | None = None
+        self.viewers = 0
+        self.failures = 0  # consecutive failed refreshes
+        # Offset the API applied to the location's series (timezone=auto)
+        self.time_zone: tzinfo | None = None
+        self._prefetched: dict[str, Any] | None = None
+        # Only close a transport this coordinator created, shared ones outlive it
+        self._owns_transport = transport is None
+        self._transport = transport or HttpxTransport(
+            API_BASE_URL, client=get_async_client(hass)
+        )
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=update_interval,
+            update_interval=None if scheduled else update_interval,
         )
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Update data via library."""
         try:
-            return await self._fetch_marine_data()
+            if self.grid is not None:
+                data = await self._fetch_grid_data()
+            else:
+                data = await self._fetch_marine_data()
         except Exception as exception:
+            self.async_record_failure()
             raise UpdateFailed(f"Error communicating with API: {exception}") from exception
 
-    async def _fetch_marine_data(self) -> dict[str, Any]:
-        """Fetch marine data from Open Meteo API."""
+        self.last_fetch = self.last_attempt = time.monotonic()
+        self.failures = 0
+        observed = data.get("observed") or int(data["last_updated"].timestamp())
+        self.history.add(observed, data)
+        if "hourly" in data:
+            data["daily"] = self._daily_summaries(data["hourly"])
+        return data
+
+    def _daily_summaries(self, hourly: MarineColumns) -> list[dict[str, Any]]:
+        """Return daily summaries, recomputed only when the forecast changed."""
+        if hourly != self._hourly:
+            with self.profiler.span("summarize", self._label):
+                self._daily = daily_aggregates(
+                    hourly, self.location_time_zone, DIRECTIONAL_SENSOR_TYPES
+                )
+            self._hourly = hourly
+            self.forecast_revision += 1
+        return self._daily
+
+    @property
+    def location_time_zone(self) -> tzinfo:
+        """Return the time zone the location's days start in."""
+        return self.time_zone or dt_util.get_time_zone(self.hass.config.time_zone)
+
+    def today(self) -> dict[str, Any] | None:
+        """Return the daily summary of the current day at the location."""
+        if not self.data:
+            return None
+        today = dt_util.now(self.location_time_zone).date().isoformat()
+        return next((day for day in self.data.get("daily", []) if day["date"] == today), None)
+
+    @callback
+    def async_record_failure(self) -> None:
+        """Record a failed refresh, so the scheduler backs off from it."""
+        self.last_attempt = time.monotonic()
+        self.failures += 1
+
+    @callback
+    def async_mark_viewed(self) -> None:
+        """Record that this location's data was just read."""
+        self.last_viewed = time.monotonic()
+
+    @callback
+    def async_set_prefetched(self, data: dict[str, Any]) -> None:
+        """Use a response fetched in a batch for the next refresh."""
+        self._prefetched = data
+
+    def request_params(self) -> dict[str, Any]:
+        """Return the API query for this location."""
         params = {
             "latitude": self.latitude,
             "longitude": self.longitude,
-            "current": [
-                "wave_height",
-                "wave_direction", 
-                "wave_period",
-                "sea_surface_temperature",
-                "ocean_current_velocity",
-                "ocean_current_direction"
-            ],
+            "current": CURRENT_VARIABLES,
             "timezone": "auto",
         }
+        if self.forecast_days:
+            params["hourly"] = CURRENT_VARIABLES
+            params["forecast_days"] = self.forecast_days
+        if self.unixtime:
+            # Epoch seconds are always GMT; timezone=auto still aligns the
+            # hourly block to the location's days and reports its zone
+            params["timeformat"] = "unixtime"
+        if self.models:
+            params["models"] = self.models
+        return params
 
+    async def _fetch_marine_data(self) -> dict[str, Any]:
+        """Fetch marine data from Open Meteo API."""
+        data, self._prefetched = self._prefetched, None
         try:
-            response = await self._client.get(API_BASE_URL, params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            if "current" not in data:
-                raise UpdateFailed("Invalid API response: missing current data")
-
-            current_data = data["current"]
-            
-            # Parse the data into a more usable format
-            parsed_data = {}
-            
-            if "wave_height" in current_data:
-                parsed_data["wave_height"] = current_data["wave_height"]
-            
-            if "wave_direction" in current_data:
-                parsed_data["wave_direction"] = current_data["wave_direction"]
-                
-            if "wave_period" in current_data:
-                parsed_data["wave_period"] = current_data["wave_period"]
-                
-            if "sea_surface_temperature" in current_data:
-                parsed_data["sea_surface_temperature"] = current_data["sea_surface_temperature"]
-                
-            if "ocean_current_velocity" in current_data:
-                parsed_data["current_velocity"] = current_data["ocean_current_velocity"]
-                
-            if "ocean_current_direction" in current_data:
-                parsed_data["current_direction"] = current_data["ocean_current_direction"]
+            if data is None:
+                with self.profiler.span("fetch", self._label):
+                    body = await self._transport.async_get(self.request_params())
+
+            with self.profiler.span("parse", self._label), self.profiler.profile():
+                if data is None:
+                    data = json_loads(body)
+
+                if "current" not in data:
+                    raise UpdateFailed("Invalid API response: missing current data")
+
+                ensemble = None
+                if self.ensemble:
+                    # Variables come back once per model, suffixed with its name
+                    data["current"], ensemble = merge_current(
+                        data["current"], CURRENT_VARIABLES, self.models, DIRECTIONAL_VARIABLES
+                    )
+                    if "hourly" in data:
+                        data["hourly"] = merge_hourly(
+                            data["hourly"], CURRENT_VARIABLES, self.models, DIRECTIONAL_VARIABLES
+                        )
+
+                tz = self.time_zone = response_timezone(data)
+                parsed_data = parse_current(data["current"])
+                parsed_data["observed"] = parse_timestamp(data["current"].get("time"), tz)
+                if "hourly" in data:
+                    parsed_data["hourly"] = parse_hourly(data["hourly"], tz)
+                if ensemble is not None:
+                    parsed_data["ensemble"] = {
+                        sensor_type: ensemble[config["api_param"]]
+                        for sensor_type, config in SENSOR_TYPES.items()
+                        if config["api_param"] in ensemble
+                    }
+                    parsed_data["model_confidence"] = confidence(ensemble)
+                parsed_data["last_updated"] = datetime.now()
+                parsed_data["attribution"] = ATTRIBUTION
 
-            parsed_data["last_updated"] = datetime.now()
-            parsed_data["attribution"] = ATTRIBUTION
-            
             _LOGGER.debug("Successfully fetched marine data: %s", parsed_data)
             return parsed_data
 
-        except httpx.RequestError as err:
-            raise UpdateFailed(f"Error requesting data: {err}") from err
-        except httpx.HTTPStatusError as err:
-            raise UpdateFailed(f"HTTP error occurred: {err}") from err
+        except MarineTransportError as err:
+            raise UpdateFailed(str(err)) from err
         except Exception as err:
             raise UpdateFailed(f"Unexpected error: {err}") from err
 
+    async def _fetch_grid_data(self) -> dict[str, Any]:
+        """Interpolate marine data from the shared grid."""
+        with self.profiler.span("fetch", self._label):
+            current_data = await self.grid.async_get(
+                self.latitude,
+                self.longitude,
+                max_age=timedelta(minutes=GRID_SNAPSHOT_MAX_AGE),
+            )
+
+        with self.profiler.span("parse", self._label), self.profiler.profile():
+            parsed_data = parse_current(current_data)
+            parsed_data["observed"] = current_data.get("time")
+            parsed_data["last_updated"] = datetime.now()
+            parsed_data["attribution"] = ATTRIBUTION
+
+        _LOGGER.debug("Interpolated marine data from grid: %s", parsed_data)
+        return parsed_data
+
+    @property
+    def ensemble(self) -> bool:
+        """Return True if several models are compared for this location."""
+        return self.grid is None and len(self.models) > 1
+
+    @property
+    def _label(self) -> str:
+        """Return the location used in timing logs."""
+        return f"({self.latitude}, {self.longitude})"
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners, timing the entity state writes."""
+        with self.profiler.span("dispatch", self._label), self.profiler.profile():
+            super().async_update_listeners()
+
     async def async_shutdown(self) -> None:
-        """Close the HTTP client."""
-        await self._client.aclose()
\ No newline at end of file
+        """Close the transport."""
+        if self._owns_transport:
+            await self._transport.async_close()
\ No newline at end of file
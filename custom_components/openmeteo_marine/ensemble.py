@@ -0,0 +1,107 @@
+"""Local ensemble statistics across Open Meteo Marine wave models."""
+from __future__ import annotations
+
+import math
+from typing import Any
+
+
+def combine(values: list[float], directional: bool) -> tuple[float, float, float]:
+    """Return the mean, spread and agreement of one variable across models.
+
+    Scalars use the population standard deviation as spread and agreement
+    ``1 - spread / |mean|``. Directions are averaged on the unit circle:
+    the spread is the circular standard deviation in degrees and the
+    agreement is the mean resultant length. Agreement is in [0, 1].
+    """
+    count = len(values)
+    if directional:
+        sin_total = cos_total = 0.0
+        for value in values:
+            radians = math.radians(value)
+            sin_total += math.sin(radians)
+            cos_total += math.cos(radians)
+        resultant = min(1.0, math.hypot(sin_total, cos_total) / count)
+        mean = math.degrees(math.atan2(sin_total, cos_total)) % 360.0
+        spread = (
+            min(180.0, math.degrees(math.sqrt(-2.0 * math.log(resultant))))
+            if resultant > 0
+            else 180.0
+        )
+        return mean, spread, resultant
+
+    mean = math.fsum(values) / count
+    spread = math.sqrt(math.fsum((value - mean) ** 2 for value in values) / count)
+    if mean:
+        agreement = max(0.0, 1.0 - spread / abs(mean))
+    else:
+        agreement = 1.0 if not spread else 0.0
+    return mean, spread, agreement
+
+
+def _model_values(block: dict[str, Any], variable: str, models: list[str]) -> dict[str, float]:
+    """Return the values each model reported for a variable."""
+    values = {}
+    for model in models:
+        value = block.get(f"{variable}_{model}")
+        if value is not None:
+            values[model] = value
+    return values
+
+
+def merge_current(
+    current: dict[str, Any], variables: list[str], models: list[str], directional: set[str]
+) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+    """Merge a multi-model "current" block into its ensemble mean.
+
+    Returns the block with plain variable names, as a single-model request
+    would have it, and per-variable statistics for variables reported by
+    at least two models.
+    """
+    merged: dict[str, Any] = {"time": current.get("time")}
+    stats = {}
+    for variable in variables:
+        values = _model_values(current, variable, models)
+        if not values:
+            continue
+        mean, spread, agreement = combine(list(values.values()), variable in directional)
+        merged[variable] = round(mean, 2)
+        if len(values) > 1:
+            stats[variable] = {
+                "mean": round(mean, 2),
+                "spread": round(spread, 2),
+                "agreement": round(agreement, 3),
+                "models": values,
+            }
+    return merged, stats
+
+
+def merge_hourly(
+    hourly: dict[str, Any], variables: list[str], models: list[str], directional: set[str]
+) -> dict[str, Any]:
+    """Merge a multi-model "hourly" block into its ensemble mean per hour."""
+    times = hourly.get("time", [])
+    merged: dict[str, Any] = {"time": times}
+    for variable in variables:
+        columns = [
+            hourly[key] for model in models if (key := f"{variable}_{model}") in hourly
+        ]
+        if not columns:
+            continue
+        is_directional = variable in directional
+        merged_column: list[float | None] = []
+        for row in zip(*columns):
+            values = [value for value in row if value is not None]
+            merged_column.append(
+                round(combine(values, is_directional)[0], 2) if values else None
+            )
+        merged[variable] = merged_column
+    return merged
+
+
+def confidence(stats: dict[str, dict[str, Any]]) -> float | None:
+    """Return a 0-100 confidence score from the models' mean agreement."""
+    if not stats:
+        return None
+    return round(
+        100.0 * math.fsum(item["agreement"] for item in stats.values()) / len(stats), 1
+    )
@@ -0,0 +1,80 @@
+"""Forecast service for Open Meteo Marine."""
+from __future__ import annotations
+
+from datetime import tzinfo
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, SERVICE_GET_FORECAST
+
+if TYPE_CHECKING:
+    from .coordinator import OpenMeteoMarineDataUpdateCoordinator
+    from .parser import MarineColumns
+
+GET_FORECAST_SCHEMA = vol.Schema({vol.Optional("config_entry_id"): cv.string})
+
+
+def serialize_hourly(columns: MarineColumns, tz: tzinfo) -> list[dict[str, Any]]:
+    """Return the hourly columns as a list of JSON-friendly rows."""
+    keys = list(columns.values)
+    rows = []
+    for position, moment in enumerate(columns.datetimes(tz)):
+        row: dict[str, Any] = {"datetime": moment.isoformat()}
+        for key in keys:
+            value = columns.values[key][position]
+            row[key] = None if value != value else value  # NaN -> None
+        rows.append(row)
+    return rows
+
+
+def _forecast_response(
+    hass: HomeAssistant, coordinator: OpenMeteoMarineDataUpdateCoordinator
+) -> dict[str, Any]:
+    """Return the forecast of one location."""
+    data = coordinator.data or {}
+    hourly = data.get("hourly")
+    return {
+        "latitude": coordinator.latitude,
+        "longitude": coordinator.longitude,
+        "hourly": serialize_hourly(
+            hourly, dt_util.get_time_zone(hass.config.time_zone)
+        )
+        if hourly is not None
+        else [],
+        "daily": data.get("daily", []),
+    }
+
+
+@callback
+def async_register_forecast_services(hass: HomeAssistant) -> None:
+    """Register the forecast service."""
+
+    async def get_forecast(call: ServiceCall) -> ServiceResponse:
+        # Registered at startup; the coordinator module is only loaded with an entry
+        from .coordinator import async_get_coordinators
+
+        coordinators = async_get_coordinators(hass)
+        if entry_id := call.data.get("config_entry_id"):
+            if entry_id not in coordinators:
+                raise ServiceValidationError(f"Unknown config entry {entry_id}")
+            coordinators = {entry_id: coordinators[entry_id]}
+
+        for coordinator in coordinators.values():
+            coordinator.async_mark_viewed()
+        return {
+            key: _forecast_response(hass, coordinator)
+            for key, coordinator in coordinators.items()
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_FORECAST,
+        get_forecast,
+        schema=GET_FORECAST_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -0,0 +1,292 @@
+"""Shared grid fetching and spatial interpolation for Open Meteo Marine."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+from datetime import datetime, timedelta
+from typing import Any
+
+from .const import (
+    API_BASE_URL,
+    CURRENT_VARIABLES,
+    DIRECTIONAL_VARIABLES,
+    GRID_MAX_LOCATIONS_PER_REQUEST,
+    GRID_RESOLUTION,
+)
+from .parser import json_loads
+from .transport import HttpxTransport, MarineTransport
+
+_LOGGER = logging.getLogger(__name__)
+
+Location = tuple[float, float]
+
+
+def grid_corners(latitude: float, longitude: float, resolution: float) -> list[Location]:
+    """Return the four grid points surrounding a location."""
+    south = math.floor(latitude / resolution) * resolution
+    west = math.floor(longitude / resolution) * resolution
+    north = min(south + resolution, 90.0)
+    east = west + resolution
+    return [
+        (round(south, 6), round(west, 6)),
+        (round(south, 6), round(east, 6)),
+        (round(north, 6), round(west, 6)),
+        (round(north, 6), round(east, 6)),
+    ]
+
+
+def grid_ring(latitude: float, longitude: float, resolution: float) -> list[Location]:
+    """Return the twelve grid points around a location's corners, nearest first."""
+    south = math.floor(latitude / resolution) * resolution
+    west = math.floor(longitude / resolution) * resolution
+    corners = set(grid_corners(latitude, longitude, resolution))
+    ring = {
+        (
+            round(max(-90.0, min(90.0, south + row * resolution)), 6),
+            round(west + column * resolution, 6),
+        )
+        for row in range(-1, 3)
+        for column in range(-1, 3)
+    } - corners
+    scale = math.cos(math.radians(latitude))
+    return sorted(
+        ring,
+        key=lambda point: math.hypot(point[0] - latitude, (point[1] - longitude) * scale),
+    )
+
+
+def bilinear_weights(
+    latitude: float, longitude: float, corners: list[Location]
+) -> list[float]:
+    """Return bilinear weights of a location for its four grid corners."""
+    (south, west), _, (north, east) = corners[0], corners[1], corners[3]
+    lat_span = north - south
+    lon_span = east - west
+    y = (latitude - south) / lat_span if lat_span else 0.0
+    x = (longitude - west) / lon_span if lon_span else 0.0
+    return [(1 - x) * (1 - y), x * (1 - y), (1 - x) * y, x * y]
+
+
+class GridPlan:
+    """Precomputed interpolation stencil for a set of locations.
+
+    Every location is described by the indices of its four grid points
+    in ``nodes`` and the matching bilinear weights, so one refresh is a
+    single pass over all locations without any geometry work. Locations
+    whose whole cell is land can be widened with a fallback ring of grid
+    points, nearest first.
+    """
+
+    def __init__(self, locations: list[Location], resolution: float) -> None:
+        """Build the stencil."""
+        self.locations = list(locations)
+        self.resolution = resolution
+        self.nodes: list[Location] = []
+        self._node_index: dict[Location, int] = {}
+        self.stencils: list[tuple[list[int], list[float]]] = []
+        self.fallbacks: list[list[int]] = [[] for _ in self.locations]
+
+        for latitude, longitude in self.locations:
+            corners = grid_corners(latitude, longitude, resolution)
+            self.stencils.append(
+                (
+                    [self._node(corner) for corner in corners],
+                    bilinear_weights(latitude, longitude, corners),
+                )
+            )
+
+    def _node(self, point: Location) -> int:
+        """Return the index of a grid point, adding it if it is new."""
+        if point not in self._node_index:
+            self._node_index[point] = len(self.nodes)
+            self.nodes.append(point)
+        return self._node_index[point]
+
+    def widen(self, position: int) -> None:
+        """Give a location the ring of grid points around its cell as fallback."""
+        latitude, longitude = self.locations[position]
+        self.fallbacks[position] = [
+            self._node(point) for point in grid_ring(latitude, longitude, self.resolution)
+        ]
+
+    def interpolate(
+        self,
+        node_values: dict[str, list[float | None]],
+        directional: set[str],
+    ) -> list[dict[str, float | None]]:
+        """Interpolate node values onto every location in one pass.
+
+        Grid points without a value (land, or outside the wave model) get
+        no weight and the remaining weights are renormalized, so coastal
+        locations are driven by the neighbouring sea points only. When the
+        whole cell is land, the nearest fallback point with a value is used.
+        Directions are averaged as unit vectors.
+        """
+        results = []
+        for (indices, weights), fallback in zip(self.stencils, self.fallbacks):
+            values: dict[str, float | None] = {}
+            for variable, column in node_values.items():
+                total = 0.0
+                acc_x = 0.0
+                acc_y = 0.0
+                for index, weight in zip(indices, weights):
+                    value = column[index]
+                    if value is None or weight == 0.0:
+                        continue
+                    total += weight
+                    if variable in directional:
+                        angle = math.radians(value)
+                        acc_x += weight * math.sin(angle)
+                        acc_y += weight * math.cos(angle)
+                    else:
+                        acc_x += weight * value
+                if total == 0.0:
+                    values[variable] = next(
+                        (column[index] for index in fallback if column[index] is not None),
+                        None,
+                    )
+                elif variable in directional:
+                    values[variable] = round(
+                        math.degrees(math.atan2(acc_x, acc_y)) % 360.0, 1
+                    )
+                else:
+                    values[variable] = round(acc_x / total, 3)
+            results.append(values)
+        return results
+
+
+class MarineGrid:
+    """Serve many nearby locations from one shared set of fetched grid points."""
+
+    def __init__(
+        self,
+        resolution: float = GRID_RESOLUTION,
+        transport: MarineTransport | None = None,
+    ) -> None:
+        """Initialize."""
+        self.resolution = resolution
+        self._owns_transport = transport is None
+        self._transport = transport or HttpxTransport(API_BASE_URL)
+        self._locations: dict[Location, int] = {}
+        self._plan: GridPlan | None = None
+        self._snapshot: dict[Location, dict[str, Any]] = {}
+        self._fetched_at: datetime | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def empty(self) -> bool:
+        """Return True when no location uses the grid."""
+        return not self._locations
+
+    def register(self, latitude: float, longitude: float) -> None:
+        """Add a location served by the grid."""
+        location = (latitude, longitude)
+        self._locations[location] = self._locations.get(location, 0) + 1
+        self._plan = None
+
+    def unregister(self, latitude: float, longitude: float) -> None:
+        """Remove a location served by the grid."""
+        location = (latitude, longitude)
+        if location not in self._locations:
+            return
+        self._locations[location] -= 1
+        if not self._locations[location]:
+            del self._locations[location]
+            self._snapshot.pop(location, None)
+            self._plan = None
+
+    async def async_get(
+        self, latitude: float, longitude: float, max_age: timedelta
+    ) -> dict[str, Any]:
+        """Return interpolated current data for a registered location."""
+        location = (latitude, longitude)
+        async with self._lock:
+            if (
+                location not in self._snapshot
+                or self._fetched_at is None
+                or datetime.now() - self._fetched_at > max_age
+            ):
+                await self._async_refresh()
+            return self._snapshot[location]
+
+    async def _async_refresh(self) -> None:
+        """Fetch all grid points and interpolate every location."""
+        if self._plan is None:
+            self._plan = GridPlan(list(self._locations), self.resolution)
+        plan = self._plan
+
+        node_values: dict[str, list[float | None]] = {
+            variable: [] for variable in CURRENT_VARIABLES
+        }
+        time = await self._async_fetch_values(plan.nodes, node_values)
+        interpolated = plan.interpolate(node_values, DIRECTIONAL_VARIABLES)
+
+        # Locations whose whole cell is land, like marinas inside a harbour,
+        # fall back to the nearest sea point around it; land does not move,
+        # so the plan keeps these points for later refreshes
+        land = [
+            position
+            for position, values in enumerate(interpolated)
+            if not plan.fallbacks[position]
+            and all(value is None for value in values.values())
+        ]
+        if land:
+            fetched = len(plan.nodes)
+            for position in land:
+                plan.widen(position)
+            ring_time = await self._async_fetch_values(plan.nodes[fetched:], node_values)
+            time = time or ring_time
+            interpolated = plan.interpolate(node_values, DIRECTIONAL_VARIABLES)
+
+        _LOGGER.debug(
+            "Fetched %d grid points for %d locations",
+            len(plan.nodes),
+            len(plan.locations),
+        )
+        self._snapshot = {}
+        for location, values in zip(plan.locations, interpolated):
+            values["time"] = time
+            self._snapshot[location] = values
+        self._fetched_at = datetime.now()
+
+    async def _async_fetch_values(
+        self, nodes: list[Location], node_values: dict[str, list[float | None]]
+    ) -> int | None:
+        """Fetch grid points, appending their values to the node columns.
+
+        Returns the time of the data.
+        """
+        time = None
+        for start in range(0, len(nodes), GRID_MAX_LOCATIONS_PER_REQUEST):
+            chunk = nodes[start : start + GRID_MAX_LOCATIONS_PER_REQUEST]
+            for current in await self._async_fetch_nodes(chunk):
+                time = time or current.get("time")
+                for variable, column in node_values.items():
+                    column.append(current.get(variable))
+        return time
+
+    async def _async_fetch_nodes(self, nodes: list[Location]) -> list[dict[str, Any]]:
+        """Fetch current data for several grid points in one request."""
+        params = {
+            "latitude": ",".join(str(latitude) for latitude, _ in nodes),
+            "longitude": ",".join(str(longitude) for _, longitude in nodes),
+            "current": ",".join(CURRENT_VARIABLES),
+            "timeformat": "unixtime",
+            "timezone": "GMT",
+        }
+        data = json_loads(await self._transport.async_get(params))
+
+        # A single location is returned as an object, several as a list
+        results = data if isinstance(data, list) else [data]
+        if len(results) != len(nodes):
+            raise ValueError(
+                f"Expected {len(nodes)} grid points, API returned {len(results)}"
+            )
+        # Grid points on land come back without a usable "current" block
+        return [result.get("current") or {} for result in results]
+
+    async def async_close(self) -> None:
+        """Close the transport."""
+        if self._owns_transport:
+            await self._transport.async_close()
@@ -0,0 +1,150 @@
+"""Rolling history of recent Open Meteo Marine observations."""
+from __future__ import annotations
+
+from collections import deque
+from typing import Any
+
+
+class RollingSeries:
+    """Fixed-size window of observations with incremental statistics.
+
+    Every push is O(1): the least-squares sums behind the trend are
+    updated in place, and rolling min/max come from monotonic queues
+    whose front is the current extreme (amortized O(1)). Times are kept
+    in hours relative to an origin that is moved to the oldest sample
+    once per window, which also clears accumulated rounding error.
+    """
+
+    __slots__ = (
+        "size",
+        "_window",
+        "_minimums",
+        "_maximums",
+        "_pushed",
+        "_origin",
+        "_sum_t",
+        "_sum_v",
+        "_sum_tt",
+        "_sum_tv",
+    )
+
+    def __init__(self, size: int) -> None:
+        """Initialize."""
+        self.size = size
+        self._window: deque[tuple[int, float, float]] = deque(maxlen=size)
+        self._minimums: deque[tuple[int, float]] = deque()
+        self._maximums: deque[tuple[int, float]] = deque()
+        self._pushed = 0
+        self._origin = 0
+        self._sum_t = self._sum_v = self._sum_tt = self._sum_tv = 0.0
+
+    def __len__(self) -> int:
+        """Return the number of observations in the window."""
+        return len(self._window)
+
+    def push(self, timestamp: int, value: float) -> None:
+        """Add an observation taken at an epoch timestamp."""
+        if not self._window:
+            self._origin = timestamp
+
+        if len(self._window) == self.size:
+            _, old_t, old_v = self._window[0]
+            self._sum_t -= old_t
+            self._sum_v -= old_v
+            self._sum_tt -= old_t * old_t
+            self._sum_tv -= old_t * old_v
+
+        index = self._pushed
+        self._pushed += 1
+        t = (timestamp - self._origin) / 3600
+        self._window.append((index, t, value))
+        self._sum_t += t
+        self._sum_v += value
+        self._sum_tt += t * t
+        self._sum_tv += t * value
+
+        oldest = index - len(self._window) + 1
+        while self._minimums and self._minimums[-1][1] >= value:
+            self._minimums.pop()
+        self._minimums.append((index, value))
+        while self._minimums[0][0] < oldest:
+            self._minimums.popleft()
+        while self._maximums and self._maximums[-1][1] <= value:
+            self._maximums.pop()
+        self._maximums.append((index, value))
+        while self._maximums[0][0] < oldest:
+            self._maximums.popleft()
+
+        if self._pushed % self.size == 0:
+            self._rebase()
+
+    def _rebase(self) -> None:
+        """Move the time origin to the oldest sample and recompute the sums."""
+        shift = self._window[0][1]
+        self._origin += round(shift * 3600)
+        self._window = deque(
+            ((index, t - shift, value) for index, t, value in self._window),
+            maxlen=self.size,
+        )
+        self._sum_t = sum(t for _, t, _ in self._window)
+        self._sum_v = sum(value for _, _, value in self._window)
+        self._sum_tt = sum(t * t for _, t, _ in self._window)
+        self._sum_tv = sum(t * value for _, t, value in self._window)
+
+    @property
+    def trend(self) -> float | None:
+        """Return the least-squares slope over the window, per hour."""
+        count = len(self._window)
+        denominator = count * self._sum_tt - self._sum_t * self._sum_t
+        if count < 2 or denominator <= 0:
+            return None
+        return (count * self._sum_tv - self._sum_t * self._sum_v) / denominator
+
+    @property
+    def rate_of_change(self) -> float | None:
+        """Return the change per hour between the last two observations."""
+        if len(self._window) < 2:
+            return None
+        _, t_prev, v_prev = self._window[-2]
+        _, t_last, v_last = self._window[-1]
+        if t_last <= t_prev:
+            return None
+        return (v_last - v_prev) / (t_last - t_prev)
+
+    @property
+    def minimum(self) -> float | None:
+        """Return the smallest value in the window."""
+        return self._minimums[0][1] if self._minimums else None
+
+    @property
+    def maximum(self) -> float | None:
+        """Return the largest value in the window."""
+        return self._maximums[0][1] if self._maximums else None
+
+    @property
+    def span_hours(self) -> float:
+        """Return the hours covered by the window."""
+        if len(self._window) < 2:
+            return 0.0
+        return self._window[-1][1] - self._window[0][1]
+
+
+class MarineHistory:
+    """Ring buffers of recent snapshots for one location."""
+
+    def __init__(self, variables: list[str], size: int) -> None:
+        """Initialize."""
+        self.series = {variable: RollingSeries(size) for variable in variables}
+        self.last_timestamp: int | None = None
+
+    def add(self, timestamp: int, data: dict[str, Any]) -> bool:
+        """Add a snapshot, ignoring ones that are not newer than the last."""
+        if self.last_timestamp is not None and timestamp <= self.last_timestamp:
+            return False
+
+        self.last_timestamp = timestamp
+        for variable, series in self.series.items():
+            value = data.get(variable)
+            if isinstance(value, (int, float)):
+                series.push(timestamp, float(value))
+        return True
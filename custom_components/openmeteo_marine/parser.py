@@ -0,0 +1,112 @@
+"""Response parsing for Open Meteo Marine."""
+from __future__ import annotations
+
+import json
+import math
+from array import array
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Any
+
+from .const import SENSOR_TYPES
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    orjson = None
+
+
+def json_loads(body: bytes) -> Any:
+    """Decode a response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def parse_current(current_data: dict[str, Any]) -> dict[str, Any]:
+    """Map the API "current" block onto sensor keys."""
+    return {
+        sensor_type: current_data[config["api_param"]]
+        for sensor_type, config in SENSOR_TYPES.items()
+        if config["api_param"] in current_data
+    }
+
+
+class MarineColumns:
+    """Hourly forecast held as compact typed columns.
+
+    Times are UTC epoch seconds in an ``array("q")`` and every variable is
+    an ``array("d")`` keyed by sensor type, with missing values as NaN.
+    """
+
+    __slots__ = ("times", "values")
+
+    def __init__(self, times: array, values: dict[str, array]) -> None:
+        """Initialize."""
+        self.times = times
+        self.values = values
+
+    def __len__(self) -> int:
+        """Return the number of hours."""
+        return len(self.times)
+
+    def __eq__(self, other: object) -> bool:
+        """Return True if both hold the same forecast."""
+        if not isinstance(other, MarineColumns):
+            return NotImplemented
+        # Compared as bytes: missing hours are NaN, which never equals itself
+        return (
+            self.times == other.times
+            and self.values.keys() == other.values.keys()
+            and all(
+                column.tobytes() == other.values[key].tobytes()
+                for key, column in self.values.items()
+            )
+        )
+
+    def datetimes(self, tz: tzinfo) -> list[datetime]:
+        """Return the hours as aware datetimes in a time zone."""
+        return [datetime.fromtimestamp(timestamp, tz) for timestamp in self.times]
+
+
+def response_timezone(data: dict[str, Any]) -> tzinfo:
+    """Return the time zone of a response's times.
+
+    The API shifts the whole series of a response by one
+    ``utc_offset_seconds``, even when it crosses a DST change, so a fixed
+    offset is what its ISO times and day boundaries are in.
+    """
+    return timezone(timedelta(seconds=data.get("utc_offset_seconds", 0)))
+
+
+def _parse_times(raw_times: list[Any], tz: tzinfo) -> array:
+    """Convert API times to epoch seconds."""
+    if not raw_times or isinstance(raw_times[0], int):
+        # timeformat=unixtime already gives epoch seconds
+        return array("q", raw_times)
+
+    # ISO strings are local wall time without an offset; one for the series
+    return array(
+        "q",
+        (int(datetime.fromisoformat(raw).replace(tzinfo=tz).timestamp()) for raw in raw_times),
+    )
+
+
+def parse_timestamp(raw_time: Any, tz: tzinfo = timezone.utc) -> int | None:
+    """Convert a single API time to epoch seconds."""
+    if raw_time is None:
+        return None
+    return _parse_times([raw_time], tz)[0]
+
+
+def parse_hourly(hourly: dict[str, Any], tz: tzinfo = timezone.utc) -> MarineColumns:
+    """Convert the API "hourly" block into typed columns."""
+    nan = math.nan
+    values = {
+        sensor_type: array(
+            "d",
+            (nan if value is None else value for value in hourly[config["api_param"]]),
+        )
+        for sensor_type, config in SENSOR_TYPES.items()
+        if config["api_param"] in hourly
+    }
+    return MarineColumns(_parse_times(hourly.get("time", []), tz), values)
@@ -0,0 +1,262 @@
+"""On-demand profiling of the Open Meteo Marine update pipeline."""
+from __future__ import annotations
+
+import io
+import logging
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    DOMAIN,
+    DEFAULT_PROFILE_DURATION,
+    MAX_PROFILE_DURATION,
+    SERVICE_SET_TIMING,
+    SERVICE_START_PROFILE,
+    SERVICE_STOP_PROFILE,
+)
+
+if TYPE_CHECKING:
+    # Loaded when a session starts, they are not needed to register the services
+    import cProfile
+    import tracemalloc
+
+_LOGGER = logging.getLogger(__name__)
+
+COMPONENT_FILES = f"{Path(__file__).parent}/*"
+TOP_STATS = 50
+
+START_PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional("duration", default=DEFAULT_PROFILE_DURATION): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_PROFILE_DURATION)
+        ),
+        vol.Optional("cprofile", default=True): cv.boolean,
+        vol.Optional("tracemalloc", default=False): cv.boolean,
+    }
+)
+
+SET_TIMING_SCHEMA = vol.Schema({vol.Required("enabled"): cv.boolean})
+
+
+class SpanStats:
+    """Running totals for one pipeline stage."""
+
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, elapsed: float) -> None:
+        """Record one span."""
+        self.count += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+
+    def __str__(self) -> str:
+        """Return a one-line summary in milliseconds."""
+        mean = self.total / self.count if self.count else 0.0
+        return f"{self.count} calls, mean {mean * 1000:.2f} ms, max {self.max * 1000:.2f} ms"
+
+
+class MarineProfiler:
+    """Profile the coordinators' fetch, parse and dispatch stages.
+
+    Timing spans are cheap and can be switched on at runtime. cProfile is
+    only enabled inside the synchronous parse and dispatch sections, so
+    the profile is not polluted by whatever else runs on the event loop
+    while a request is in flight. tracemalloc keeps the allocations that
+    have a frame inside this integration.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.timing_enabled = False
+        self.timings: dict[str, SpanStats] = {}
+        self._profile: cProfile.Profile | None = None
+        self._tracemalloc = False
+        self._started_tracemalloc = False
+        self._started_at: datetime | None = None
+        self._cancel_stop: Callable[[], None] | None = None
+
+    @property
+    def active(self) -> bool:
+        """Return True while a profiling session runs."""
+        return self._started_at is not None
+
+    @contextmanager
+    def span(self, stage: str, label: str = "") -> Iterator[None]:
+        """Time a pipeline stage when timing or profiling is on."""
+        if not (self.timing_enabled or self.active):
+            yield
+            return
+
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self.timings.setdefault(stage, SpanStats()).add(elapsed)
+            _LOGGER.debug("%s %s took %.2f ms", label, stage, elapsed * 1000)
+
+    @contextmanager
+    def profile(self) -> Iterator[None]:
+        """Run a synchronous section under cProfile during a session."""
+        if self._profile is None:
+            yield
+            return
+
+        self._profile.enable()
+        try:
+            yield
+        finally:
+            self._profile.disable()
+
+    @callback
+    def async_start(self, duration: int, use_cprofile: bool, use_tracemalloc: bool) -> None:
+        """Start a profiling session that stops itself after duration seconds."""
+        if self.active:
+            _LOGGER.warning("Open Meteo Marine profiling is already running")
+            return
+
+        import cProfile
+        import tracemalloc
+
+        self.timings = {}
+        self._profile = cProfile.Profile() if use_cprofile else None
+        self._tracemalloc = use_tracemalloc
+        if use_tracemalloc and not tracemalloc.is_tracing():
+            tracemalloc.start(25)
+            self._started_tracemalloc = True
+        self._started_at = datetime.now()
+        self._cancel_stop = async_call_later(self.hass, duration, self._async_auto_stop)
+        _LOGGER.info("Started Open Meteo Marine profiling for %d seconds", duration)
+
+    async def _async_auto_stop(self, _now: datetime) -> None:
+        """Stop the session when its time is up."""
+        self._cancel_stop = None
+        await self.async_stop()
+
+    async def async_stop(self) -> list[str]:
+        """Stop the running session and write the results to the config directory."""
+        if not self.active:
+            return []
+
+        import tracemalloc
+
+        if self._cancel_stop is not None:
+            self._cancel_stop()
+            self._cancel_stop = None
+
+        profile = self._profile
+        snapshot = tracemalloc.take_snapshot() if self._tracemalloc else None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+        started_at = self._started_at
+        timings = dict(self.timings)
+        self._profile = None
+        self._tracemalloc = self._started_tracemalloc = False
+        self._started_at = None
+
+        paths = await self.hass.async_add_executor_job(
+            self._write_results, started_at, profile, snapshot, timings
+        )
+        _LOGGER.info("Open Meteo Marine profiling results written to %s", ", ".join(paths))
+        return paths
+
+    def _write_results(
+        self,
+        started_at: datetime,
+        profile: cProfile.Profile | None,
+        snapshot: tracemalloc.Snapshot | None,
+        timings: dict[str, SpanStats],
+    ) -> list[str]:
+        """Write stats files and return their paths."""
+        import pstats
+        import tracemalloc
+
+        stem = self.hass.config.path(
+            f"{DOMAIN}_profile_{started_at.strftime('%Y%m%d_%H%M%S')}"
+        )
+        report = io.StringIO()
+        report.write(f"Open Meteo Marine profile started {started_at.isoformat()}\n\n")
+        for stage, stats in timings.items():
+            report.write(f"{stage}: {stats}\n")
+
+        paths = []
+        if profile is not None:
+            profile.dump_stats(f"{stem}.prof")
+            paths.append(f"{stem}.prof")
+            report.write("\n")
+            pstats.Stats(profile, stream=report).sort_stats("cumulative").print_stats(
+                TOP_STATS
+            )
+
+        if snapshot is not None:
+            snapshot = snapshot.filter_traces(
+                [tracemalloc.Filter(True, COMPONENT_FILES, all_frames=True)]
+            )
+            report.write("\nTop allocations through openmeteo_marine:\n")
+            for stat in snapshot.statistics("traceback")[:TOP_STATS]:
+                report.write(f"{stat}\n")
+                report.writelines(f"    {line}\n" for line in stat.traceback.format()[-3:])
+
+        Path(f"{stem}.txt").write_text(report.getvalue(), encoding="utf-8")
+        paths.append(f"{stem}.txt")
+        return paths
+
+    @callback
+    def async_set_timing(self, enabled: bool) -> None:
+        """Switch the timing spans on or off."""
+        if not enabled and self.timings:
+            for stage, stats in self.timings.items():
+                _LOGGER.info("Open Meteo Marine %s timing: %s", stage, stats)
+        if enabled and not self.timing_enabled:
+            self.timings = {}
+        self.timing_enabled = enabled
+
+
+@callback
+def async_get_profiler(hass: HomeAssistant) -> MarineProfiler:
+    """Return the profiler shared by all coordinators."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if "profiler" not in domain_data:
+        domain_data["profiler"] = MarineProfiler(hass)
+    return domain_data["profiler"]
+
+
+@callback
+def async_register_profiling_services(hass: HomeAssistant) -> None:
+    """Register the profiling services."""
+    profiler = async_get_profiler(hass)
+
+    async def start_profile(call: ServiceCall) -> None:
+        profiler.async_start(
+            call.data["duration"], call.data["cprofile"], call.data["tracemalloc"]
+        )
+
+    async def stop_profile(call: ServiceCall) -> None:
+        await profiler.async_stop()
+
+    async def set_timing(call: ServiceCall) -> None:
+        profiler.async_set_timing(call.data["enabled"])
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_START_PROFILE, start_profile, schema=START_PROFILE_SCHEMA
+    )
+    hass.services.async_register(DOMAIN, SERVICE_STOP_PROFILE, stop_profile)
+    hass.services.async_register(
+        DOMAIN, SERVICE_SET_TIMING, set_timing, schema=SET_TIMING_SCHEMA
+    )
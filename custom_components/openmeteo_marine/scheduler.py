@@ -0,0 +1,228 @@
+"""Central, priority-weighted refresh scheduling for Open Meteo Marine."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections.abc import Callable, Hashable
+from datetime import datetime, timedelta
+from typing import Any, TypeVar
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from .const import (
+    GRID_MAX_LOCATIONS_PER_REQUEST,
+    PRIORITY_WEIGHTS,
+    SCHEDULER_BURST,
+    SCHEDULER_MIN_INTERVAL,
+    SCHEDULER_REQUEST_BUDGET,
+    SCHEDULER_RETRY,
+    SCHEDULER_RIDE_ALONG,
+    SCHEDULER_TICK,
+    SCHEDULER_VIEW_WINDOW,
+    SCHEDULER_VOLATILITY_SCALE,
+)
+from .coordinator import OpenMeteoMarineDataUpdateCoordinator
+from .parser import json_loads
+from .transport import MarineTransport, MarineTransportError, canonical_params
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+GRID_BATCH = "grid"
+
+
+def plan_batches(
+    candidates: list[tuple[float, Hashable, _T]],
+    budget: int,
+    batch_size: int,
+    ride_along: float = SCHEDULER_RIDE_ALONG,
+) -> list[list[_T]]:
+    """Pick which candidates to refresh this round and how to batch them.
+
+    Candidates are ``(score, batch key, item)`` and only items with the
+    same key can share a request. In descending score order, items scoring
+    at least 1 are due: each batch they open costs one request of the
+    budget, and due items left without budget wait for a later round.
+    Items scoring at least ``ride_along`` then fill free slots of batches
+    that are already going out, at no extra cost.
+    """
+    open_batches: dict[Hashable, list[_T]] = {}
+    batches: list[list[_T]] = []
+    for score, key, item in sorted(candidates, key=lambda candidate: -candidate[0]):
+        if score < ride_along:
+            break
+        batch = open_batches.get(key)
+        if batch is not None and len(batch) < batch_size:
+            batch.append(item)
+        elif score >= 1.0 and budget >= 1:
+            budget -= 1
+            open_batches[key] = [item]
+            batches.append(open_batches[key])
+    return batches
+
+
+class MarineScheduler:
+    """Own the refreshes of every location.
+
+    Each round scores the locations by how far into their update interval
+    they are, weighted by their priority, how recently their data was read
+    (or is being watched) and how fast their waves have been changing. The
+    weights can at most halve a location's interval, and never below
+    SCHEDULER_MIN_INTERVAL; failing locations are retried with exponential
+    backoff instead. The shared request budget is a token bucket; locations
+    that use the same query are batched into multi-location requests, and
+    lower-value locations ride along in batches that are already going out.
+    """
+
+    def __init__(self, hass: HomeAssistant, transport: MarineTransport) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._transport = transport
+        self._coordinators: list[OpenMeteoMarineDataUpdateCoordinator] = []
+        self._tokens = float(SCHEDULER_BURST)
+        self._refilled = time.monotonic()
+        self._running = False
+        self._cancel_tick: Callable[[], None] | None = None
+
+    @property
+    def empty(self) -> bool:
+        """Return True if no location is scheduled."""
+        return not self._coordinators
+
+    def register(self, coordinator: OpenMeteoMarineDataUpdateCoordinator) -> None:
+        """Start scheduling a location's refreshes."""
+        self._coordinators.append(coordinator)
+        if self._cancel_tick is None:
+            self._cancel_tick = async_track_time_interval(
+                self.hass, self._async_tick, timedelta(seconds=SCHEDULER_TICK)
+            )
+
+    def unregister(self, coordinator: OpenMeteoMarineDataUpdateCoordinator) -> None:
+        """Stop scheduling a location."""
+        if coordinator in self._coordinators:
+            self._coordinators.remove(coordinator)
+        if self.empty and self._cancel_tick is not None:
+            self._cancel_tick()
+            self._cancel_tick = None
+
+    def score(self, coordinator: OpenMeteoMarineDataUpdateCoordinator, now: float) -> float:
+        """Return how urgently a location should be refreshed; 1 means due."""
+        if coordinator.failures:
+            # Retry after 1, 2, 4... minutes, but at least once per interval
+            backoff = min(
+                SCHEDULER_RETRY * 2 ** (coordinator.failures - 1),
+                coordinator.refresh_interval.total_seconds(),
+            )
+            return (now - coordinator.last_attempt) / backoff
+        if coordinator.last_fetch is None:
+            return math.inf
+
+        interval = coordinator.refresh_interval.total_seconds()
+        elapsed = now - coordinator.last_fetch
+        if elapsed < max(interval / 2, SCHEDULER_MIN_INTERVAL * 60):
+            # Not even a free ride before the minimum interval has passed
+            return 0.0
+
+        weight = PRIORITY_WEIGHTS.get(coordinator.priority, 1.0)
+
+        if coordinator.viewers:
+            attention = 2.0
+        elif coordinator.last_viewed is not None:
+            age = now - coordinator.last_viewed
+            attention = 1.0 + max(0.0, 1.0 - age / (SCHEDULER_VIEW_WINDOW * 60))
+        else:
+            attention = 1.0
+
+        trend = coordinator.history.series["wave_height"].trend
+        volatility = 1.0
+        if trend is not None:
+            volatility += min(1.0, abs(trend) / SCHEDULER_VOLATILITY_SCALE)
+
+        return elapsed / interval * weight * attention * volatility
+
+    @staticmethod
+    def batch_key(coordinator: OpenMeteoMarineDataUpdateCoordinator) -> Hashable:
+        """Return the key of the requests a location can share."""
+        if coordinator.grid is not None:
+            # The grid batches its own fetches and reuses recent snapshots
+            return GRID_BATCH
+        params = coordinator.request_params()
+        del params["latitude"], params["longitude"]
+        return tuple(canonical_params(params).items())
+
+    async def _async_tick(self, _now: datetime | None = None) -> None:
+        """Run one scheduling round."""
+        if self._running:
+            return
+
+        now = time.monotonic()
+        self._tokens = min(
+            float(SCHEDULER_BURST),
+            self._tokens + (now - self._refilled) * SCHEDULER_REQUEST_BUDGET / 3600,
+        )
+        self._refilled = now
+
+        batches = plan_batches(
+            [
+                (self.score(coordinator, now), self.batch_key(coordinator), coordinator)
+                for coordinator in self._coordinators
+            ],
+            int(self._tokens),
+            GRID_MAX_LOCATIONS_PER_REQUEST,
+        )
+        if not batches:
+            return
+
+        self._tokens -= len(batches)
+        _LOGGER.debug(
+            "Refreshing %d locations in %d requests, %.1f requests left",
+            sum(len(batch) for batch in batches),
+            len(batches),
+            self._tokens,
+        )
+        self._running = True
+        try:
+            await asyncio.gather(*(self._async_refresh_batch(batch) for batch in batches))
+        finally:
+            self._running = False
+
+    async def _async_refresh_batch(
+        self, coordinators: list[OpenMeteoMarineDataUpdateCoordinator]
+    ) -> None:
+        """Refresh locations, sharing one multi-location request when possible."""
+        if len(coordinators) > 1 and coordinators[0].grid is None:
+            try:
+                locations = await self._async_fetch_locations(coordinators)
+            except (MarineTransportError, ValueError) as err:
+                for coordinator in coordinators:
+                    coordinator.async_record_failure()
+                    coordinator.async_set_update_error(
+                        UpdateFailed(f"Error communicating with API: {err}")
+                    )
+                return
+            for coordinator, location in zip(coordinators, locations):
+                coordinator.async_set_prefetched(location)
+
+        await asyncio.gather(*(coordinator.async_refresh() for coordinator in coordinators))
+
+    async def _async_fetch_locations(
+        self, coordinators: list[OpenMeteoMarineDataUpdateCoordinator]
+    ) -> list[dict[str, Any]]:
+        """Fetch several locations sharing the same query in one request."""
+        params = coordinators[0].request_params()
+        params["latitude"] = [coordinator.latitude for coordinator in coordinators]
+        params["longitude"] = [coordinator.longitude for coordinator in coordinators]
+
+        profiler = coordinators[0].profiler
+        with profiler.span("fetch", f"(batch of {len(coordinators)})"):
+            body = await self._transport.async_get(params)
+        with profiler.span("decode", f"(batch of {len(coordinators)})"):
+            locations = json_loads(body)
+        if not isinstance(locations, list) or len(locations) != len(coordinators):
+            raise ValueError("Unexpected number of locations in the response")
+        return locations
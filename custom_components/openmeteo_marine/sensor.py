@@ -10,7 +10,14 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, SENSOR_TYPES, ATTRIBUTION
+from .const import (
+    DOMAIN,
+    SENSOR_TYPES,
+    HISTORY_SENSOR_TYPES,
+    SUMMARY_SENSOR_TYPES,
+    ENSEMBLE_SENSOR_TYPES,
+    ATTRIBUTION,
+)
 from .coordinator import OpenMeteoMarineDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -22,11 +29,7 @@ async def async_setup_entry(
     """Set up the sensor platform from config entry."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = []
-    for sensor_type, config in SENSOR_TYPES.items():
-        entities.append(OpenMeteoMarineSensor(coordinator, sensor_type, config))
-
-    async_add_entities(entities)
+    async_add_entities(_build_entities(coordinator))
 
 
 async def async_setup_platform(
@@ -38,11 +41,27 @@ async def async_setup_platform(
 
     coordinator = hass.data[DOMAIN]["yaml_config"]
 
-    entities = []
-    for sensor_type, sensor_config in SENSOR_TYPES.items():
-        entities.append(OpenMeteoMarineSensor(coordinator, sensor_type, sensor_config))
+    async_add_entities(_build_entities(coordinator))
 
-    async_add_entities(entities)
+
+def _build_entities(coordinator: OpenMeteoMarineDataUpdateCoordinator) -> list[SensorEntity]:
+    """Return all sensors for a coordinator."""
+    entities: list[SensorEntity] = []
+    for sensor_type, config in SENSOR_TYPES.items():
+        entities.append(OpenMeteoMarineSensor(coordinator, sensor_type, config))
+
+    for sensor_type, config in HISTORY_SENSOR_TYPES.items():
+        entities.append(OpenMeteoMarineHistorySensor(coordinator, sensor_type, config))
+
+    if coordinator.forecast_days:
+        for sensor_type, config in SUMMARY_SENSOR_TYPES.items():
+            entities.append(OpenMeteoMarineSummarySensor(coordinator, sensor_type, config))
+
+    if coordinator.ensemble:
+        for sensor_type, config in ENSEMBLE_SENSOR_TYPES.items():
+            entities.append(OpenMeteoMarineEnsembleSensor(coordinator, sensor_type, config))
+
+    return entities
 
 
 class OpenMeteoMarineSensor(CoordinatorEntity, SensorEntity):
@@ -101,6 +120,14 @@ class OpenMeteoMarineSensor(CoordinatorEntity, SensorEntity):
         """Return if entity is available."""
         return self.coordinator.last_update_success and self.native_value is not None
 
+    async def async_update(self) -> None:
+        """Count an update_entity call as a read of the location.
+
+        The data itself is only fetched by the scheduler, within the shared
+        request budget, which this read makes the location more urgent for.
+        """
+        self.coordinator.async_mark_viewed()
+
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes."""
@@ -112,5 +139,67 @@ class OpenMeteoMarineSensor(CoordinatorEntity, SensorEntity):
             
             if "last_updated" in self.coordinator.data:
                 attrs["last_updated"] = self.coordinator.data["last_updated"].isoformat()
+
+            stats = self.coordinator.data.get("ensemble", {}).get(self._sensor_type)
+            if stats:
+                attrs["model_spread"] = stats["spread"]
+                attrs["model_values"] = stats["models"]
         
-        return attrs
\ No newline at end of file
+        return attrs
+
+
+class OpenMeteoMarineHistorySensor(OpenMeteoMarineSensor):
+    """Trend or rolling statistic computed from the coordinator's history."""
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the statistic over the rolling history."""
+        series = self.coordinator.history.series[self._config["source"]]
+        value = getattr(series, self._config["statistic"])
+        if value is None:
+            return None
+        return round(value, 3)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the state attributes."""
+        attrs = super().extra_state_attributes
+        series = self.coordinator.history.series[self._config["source"]]
+        attrs["samples"] = len(series)
+        attrs["window_hours"] = round(series.span_hours, 2)
+        return attrs
+
+
+class OpenMeteoMarineSummarySensor(OpenMeteoMarineSensor):
+    """Daily summary of the hourly forecast, with upcoming days as attributes."""
+
+    @property
+    def native_value(self) -> float | None:
+        """Return today's value at the location."""
+        today = self.coordinator.today()
+        return today.get(self._config["source"]) if today else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the state attributes."""
+        attrs = super().extra_state_attributes
+        if self.coordinator.data:
+            attrs["forecast"] = [
+                {"date": day["date"], "value": day.get(self._config["source"])}
+                for day in self.coordinator.data.get("daily", [])
+            ]
+        return attrs
+
+
+class OpenMeteoMarineEnsembleSensor(OpenMeteoMarineSensor):
+    """Agreement between the requested models, computed locally."""
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the confidence score or a variable's spread across models."""
+        if not self.coordinator.data:
+            return None
+        if self._config["statistic"] == "confidence":
+            return self.coordinator.data.get("model_confidence")
+        stats = self.coordinator.data.get("ensemble", {}).get(self._config["source"])
+        return stats[self._config["statistic"]] if stats else None
\ No newline at end of file
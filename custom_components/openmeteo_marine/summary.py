@@ -0,0 +1,87 @@
+"""Daily summaries computed locally from hourly Open Meteo Marine data."""
+from __future__ import annotations
+
+import math
+from bisect import bisect_right
+from datetime import date, datetime, time, timedelta, tzinfo
+from typing import Any
+
+from .parser import MarineColumns
+
+
+def _day_starts(first: int, last: int, tz: tzinfo) -> list[tuple[date, int]]:
+    """Return each local date in a range with the epoch of its midnight.
+
+    Only one time zone conversion per day is needed, so the hourly values
+    can then be bucketed by plain integer comparisons.
+    """
+    day = datetime.fromtimestamp(first, tz).date()
+    last_day = datetime.fromtimestamp(last, tz).date()
+    starts = []
+    while day <= last_day:
+        midnight = datetime.combine(day, time.min, tz)
+        starts.append((day, int(midnight.timestamp())))
+        day += timedelta(days=1)
+    return starts
+
+
+def daily_aggregates(
+    columns: MarineColumns, tz: tzinfo, directional: set[str]
+) -> list[dict[str, Any]]:
+    """Aggregate hourly columns per local day in a single pass.
+
+    Scalar variables get ``<key>_min``, ``<key>_max`` and ``<key>_mean``;
+    directional ones get ``<key>_mean`` as a circular mean. Missing (NaN)
+    hours are skipped.
+    """
+    if not len(columns):
+        return []
+
+    starts = _day_starts(columns.times[0], columns.times[-1], tz)
+    boundaries = [start for _, start in starts]
+    day_count = len(starts)
+
+    # Running accumulators per variable and day: [count, min, max, sum, sum_cos]
+    accumulators = {
+        key: [[0, math.inf, -math.inf, 0.0, 0.0] for _ in range(day_count)]
+        for key in columns.values
+    }
+
+    day_index = 0
+    for position, timestamp in enumerate(columns.times):
+        if day_index + 1 < day_count and timestamp >= boundaries[day_index + 1]:
+            day_index = bisect_right(boundaries, timestamp) - 1
+        for key, column in columns.values.items():
+            value = column[position]
+            if value != value:  # NaN
+                continue
+            acc = accumulators[key][day_index]
+            acc[0] += 1
+            if key in directional:
+                radians = math.radians(value)
+                acc[3] += math.sin(radians)
+                acc[4] += math.cos(radians)
+            else:
+                if value < acc[1]:
+                    acc[1] = value
+                if value > acc[2]:
+                    acc[2] = value
+                acc[3] += value
+
+    summaries = []
+    for index, (day, _) in enumerate(starts):
+        summary: dict[str, Any] = {"date": day.isoformat()}
+        for key, days in accumulators.items():
+            count, minimum, maximum, total, total_cos = days[index]
+            if not count:
+                continue
+            if key in directional:
+                summary[f"{key}_mean"] = round(
+                    math.degrees(math.atan2(total, total_cos)) % 360.0, 1
+                )
+            else:
+                summary[f"{key}_min"] = round(minimum, 2)
+                summary[f"{key}_max"] = round(maximum, 2)
+                summary[f"{key}_mean"] = round(total / count, 2)
+        summaries.append(summary)
+    return summaries
@@ -0,0 +1,272 @@
+"""HTTP transports for the Open Meteo Marine API.
+
+The coordinator and the shared grid only need raw response bodies, so the
+network layer is pluggable: the live API, a recorder that saves responses
+as compressed fixtures, and a replay transport that serves those fixtures
+(or synthesized payloads) with configurable latency and error injection.
+
+This module deliberately has no Home Assistant imports so the standalone
+scripts in the repository root can load it directly.
+"""
+from __future__ import annotations
+
+import asyncio
+import gzip
+import hashlib
+import json
+import math
+import random
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import httpx
+
+FIXTURE_SUFFIX = ".json.gz"
+
+
+class MarineTransportError(Exception):
+    """Error to indicate a request to the API failed."""
+
+
+class MissingFixtureError(MarineTransportError):
+    """Error to indicate no fixture was recorded for a request."""
+
+
+def canonical_params(params: dict[str, Any]) -> dict[str, str]:
+    """Return query parameters as sorted, comma-joined strings."""
+    return {
+        key: ",".join(str(item) for item in value)
+        if isinstance(value, (list, tuple))
+        else str(value)
+        for key, value in sorted(params.items())
+    }
+
+
+def fixture_key(params: dict[str, Any]) -> str:
+    """Return the fixture file name stem for a set of query parameters."""
+    encoded = json.dumps(canonical_params(params), sort_keys=True)
+    return hashlib.sha1(encoded.encode()).hexdigest()[:16]
+
+
+class MarineTransport(ABC):
+    """Base class for fetching raw API response bodies."""
+
+    @abstractmethod
+    async def async_get(self, params: dict[str, Any]) -> bytes:
+        """Return the response body for a request."""
+
+    async def async_close(self) -> None:
+        """Release any resources held by the transport."""
+
+
+class HttpxTransport(MarineTransport):
+    """Transport talking to the API over HTTP.
+
+    httpx is imported on first use rather than with this module, as it is
+    by far the most expensive import on the integration's load path.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        client: httpx.AsyncClient | None = None,
+        timeout: float = 30.0,
+    ) -> None:
+        """Initialize."""
+        self.url = url
+        self._timeout = timeout
+        self._owns_client = client is None
+        if client is None:
+            import httpx
+
+            client = httpx.AsyncClient(timeout=timeout)
+        self._client = client
+
+    async def async_get(self, params: dict[str, Any]) -> bytes:
+        """Return the response body for a request."""
+        import httpx
+
+        try:
+            # Passed per request: a shared client has its own, shorter default
+            response = await self._client.get(
+                self.url, params=canonical_params(params), timeout=self._timeout
+            )
+            response.raise_for_status()
+        except httpx.RequestError as err:
+            raise MarineTransportError(f"Error requesting data: {err}") from err
+        except httpx.HTTPStatusError as err:
+            raise MarineTransportError(f"HTTP error occurred: {err}") from err
+        return response.content
+
+    async def async_close(self) -> None:
+        """Close the HTTP client if this transport created it."""
+        if self._owns_client:
+            await self._client.aclose()
+
+
+class RecordingTransport(MarineTransport):
+    """Transport saving every response of another transport as a fixture."""
+
+    def __init__(self, transport: MarineTransport, fixture_dir: str | Path) -> None:
+        """Initialize."""
+        self._transport = transport
+        self.fixture_dir = Path(fixture_dir)
+
+    async def async_get(self, params: dict[str, Any]) -> bytes:
+        """Return the response body and record it."""
+        body = await self._transport.async_get(params)
+        self.fixture_dir.mkdir(parents=True, exist_ok=True)
+        fixture = {"params": canonical_params(params), "body": body.decode()}
+        path = self.fixture_dir / f"{fixture_key(params)}{FIXTURE_SUFFIX}"
+        path.write_bytes(gzip.compress(json.dumps(fixture).encode()))
+        return body
+
+    async def async_close(self) -> None:
+        """Close the wrapped transport."""
+        await self._transport.async_close()
+
+
+class ReplayTransport(MarineTransport):
+    """Transport serving recorded fixtures instead of the live API.
+
+    Requests without a recorded fixture are answered with a synthesized
+    payload when ``synthesize`` is set, and fail otherwise. ``latency``,
+    ``jitter`` (both in seconds) and ``error_rate`` shape every response,
+    and ``seed`` makes the injected jitter and errors reproducible.
+    """
+
+    def __init__(
+        self,
+        fixture_dir: str | Path | None = None,
+        *,
+        synthesize: bool = False,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize."""
+        self.fixture_dir = Path(fixture_dir) if fixture_dir else None
+        self.synthesize = synthesize
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.requests = 0
+        self.bytes_served = 0
+        self._random = random.Random(seed)
+        self._cache: dict[str, bytes] = {}
+
+    async def async_get(self, params: dict[str, Any]) -> bytes:
+        """Return the recorded or synthesized response body."""
+        self.requests += 1
+        delay = self.latency + self.jitter * self._random.random()
+        if delay:
+            await asyncio.sleep(delay)
+        if self.error_rate and self._random.random() < self.error_rate:
+            raise MarineTransportError("Injected error")
+
+        body = self._load(params)
+        self.bytes_served += len(body)
+        return body
+
+    def _load(self, params: dict[str, Any]) -> bytes:
+        """Return the body for a request from the cache, disk or synthesizer."""
+        key = fixture_key(params)
+        if key in self._cache:
+            return self._cache[key]
+
+        path = self.fixture_dir / f"{key}{FIXTURE_SUFFIX}" if self.fixture_dir else None
+        if path is not None and path.exists():
+            body = json.loads(gzip.decompress(path.read_bytes()))["body"].encode()
+        elif self.synthesize:
+            body = synthesize_response(params)
+        else:
+            raise MissingFixtureError(
+                f"No fixture recorded for {canonical_params(params)}"
+            )
+
+        self._cache[key] = body
+        return body
+
+
+def _synthetic_value(variable: str, latitude: float, longitude: float, hour: float) -> float:
+    """Return a deterministic, plausible value for a marine variable."""
+    phase = latitude * 0.7 + longitude * 0.3 + hour / 6.0
+    if "direction" in variable:
+        return round((180.0 + 150.0 * math.sin(phase)) % 360.0, 1)
+    if variable == "wave_height":
+        return round(1.5 + math.sin(phase), 2)
+    if variable == "wave_period":
+        return round(9.0 + 3.0 * math.cos(phase), 2)
+    if variable == "sea_surface_temperature":
+        return round(28.0 - abs(latitude) * 0.3 + 0.5 * math.sin(hour / 24.0), 1)
+    if variable == "ocean_current_velocity":
+        return round(0.4 + 0.3 * math.cos(phase), 2)
+    return round(math.sin(phase), 3)
+
+
+def _model_key(variable: str, model: str) -> str:
+    """Return the response key of a variable for one of several models."""
+    return f"{variable}_{model}" if model else variable
+
+
+def synthesize_response(params: dict[str, Any]) -> bytes:
+    """Build a payload shaped like the API's for any request.
+
+    Comma-separated coordinates produce a list of locations, the
+    ``current`` and ``hourly`` blocks follow the requested variables,
+    several ``models`` suffix every variable with the model name, slightly
+    perturbed per model, and ``timeformat=unixtime`` switches times to
+    epoch seconds.
+    """
+    query = canonical_params(params)
+    latitudes = [float(value) for value in query["latitude"].split(",")]
+    longitudes = [float(value) for value in query["longitude"].split(",")]
+    unixtime = query.get("timeformat") == "unixtime"
+    models = query["models"].split(",") if "models" in query else []
+    if len(models) < 2:
+        # A single model answers with plain variable names
+        models = [""]
+
+    now = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    start = now.replace(hour=0)
+    hours = 24 * int(query.get("forecast_days", 7))
+
+    def format_time(moment: datetime) -> int | str:
+        return int(moment.timestamp()) if unixtime else moment.strftime("%Y-%m-%dT%H:%M")
+
+    results = []
+    for latitude, longitude in zip(latitudes, longitudes):
+        result: dict[str, Any] = {
+            "latitude": latitude,
+            "longitude": longitude,
+            "generationtime_ms": 0.1,
+            "utc_offset_seconds": 0,
+            "timezone": "GMT",
+            "timezone_abbreviation": "GMT",
+        }
+        if "current" in query:
+            current: dict[str, Any] = {"time": format_time(now), "interval": 3600}
+            for variable in query["current"].split(","):
+                for index, model in enumerate(models):
+                    current[_model_key(variable, model)] = _synthetic_value(
+                        variable, latitude + index * 0.5, longitude, now.hour
+                    )
+            result["current"] = current
+        if "hourly" in query:
+            times = [start + timedelta(hours=offset) for offset in range(hours)]
+            hourly: dict[str, Any] = {"time": [format_time(moment) for moment in times]}
+            for variable in query["hourly"].split(","):
+                for index, model in enumerate(models):
+                    hourly[_model_key(variable, model)] = [
+                        _synthetic_value(variable, latitude + index * 0.5, longitude, offset)
+                        for offset in range(hours)
+                    ]
+            result["hourly"] = hourly
+        results.append(result)
+
+    payload = results if len(results) > 1 else results[0]
+    return json.dumps(payload).encode()
@@ -0,0 +1,186 @@
+"""Platform for weather integration."""
+from __future__ import annotations
+
+import logging
+from datetime import date, datetime, time
+from typing import Any, Literal
+
+from homeassistant.components.weather import Forecast, WeatherEntity, WeatherEntityFeature
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfTemperature
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, SENSOR_TYPES, ATTRIBUTION
+from .coordinator import OpenMeteoMarineDataUpdateCoordinator
+from .forecast import serialize_hourly
+
+_LOGGER = logging.getLogger(__name__)
+
+# Forecast fields filled from the marine variables, so weather cards have
+# something to show; the marine keys are kept alongside them
+HOURLY_FORECAST_FIELDS = {"native_temperature": "sea_surface_temperature"}
+DAILY_FORECAST_FIELDS = {
+    "native_temperature": "sea_surface_temperature_max",
+    "native_templow": "sea_surface_temperature_min",
+}
+
+
+def _with_forecast_fields(row: dict[str, Any], fields: dict[str, str]) -> Forecast:
+    """Return a forecast row with the weather forecast fields filled in."""
+    return {**row, **{field: row.get(source) for field, source in fields.items()}}
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up the weather platform from config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    if coordinator.forecast_days:
+        async_add_entities([OpenMeteoMarineWeather(coordinator)])
+
+
+async def async_setup_platform(
+    hass: HomeAssistant, config, async_add_entities: AddEntitiesCallback, discovery_info=None
+) -> None:
+    """Set up the weather platform from YAML configuration."""
+    if discovery_info is None:
+        return
+
+    coordinator = hass.data[DOMAIN]["yaml_config"]
+
+    if coordinator.forecast_days:
+        async_add_entities([OpenMeteoMarineWeather(coordinator)])
+
+
+class OpenMeteoMarineWeather(CoordinatorEntity, WeatherEntity):
+    """Marine forecast of one location.
+
+    The forecast is serialized once per change of the hourly data and the
+    same lists are served to every subscriber and service call. Refreshes
+    that return an unchanged forecast push nothing to subscribers.
+    """
+
+    _attr_supported_features = (
+        WeatherEntityFeature.FORECAST_HOURLY | WeatherEntityFeature.FORECAST_DAILY
+    )
+    _attr_native_temperature_unit = UnitOfTemperature.CELSIUS
+
+    def __init__(self, coordinator: OpenMeteoMarineDataUpdateCoordinator) -> None:
+        """Initialize the weather entity."""
+        super().__init__(coordinator)
+
+        self._attr_name = "Open Meteo Marine Forecast"
+        self._attr_unique_id = f"{coordinator.latitude}_{coordinator.longitude}_weather"
+        self._attr_attribution = ATTRIBUTION
+        self._revision = coordinator.forecast_revision
+        self._forecasts: dict[str, list[Forecast]] = {}
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """Return device information about this Open Meteo Marine instance."""
+        return {
+            "identifiers": {(DOMAIN, f"{self.coordinator.latitude}_{self.coordinator.longitude}")},
+            "name": f"Open Meteo Marine ({self.coordinator.latitude}, {self.coordinator.longitude})",
+            "manufacturer": "Open Meteo",
+            "model": "Marine Weather API",
+            "sw_version": "1.0",
+        }
+
+    @property
+    def condition(self) -> str | None:
+        """Return the condition; the marine API does not report one."""
+        return None
+
+    @property
+    def native_temperature(self) -> float | None:
+        """Return the current sea surface temperature."""
+        if not self.coordinator.data:
+            return None
+        return self.coordinator.data.get("sea_surface_temperature")
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the current marine conditions."""
+        attrs: dict[str, Any] = {
+            "latitude": self.coordinator.latitude,
+            "longitude": self.coordinator.longitude,
+        }
+        if self.coordinator.data:
+            for sensor_type in SENSOR_TYPES:
+                if sensor_type in self.coordinator.data:
+                    attrs[sensor_type] = self.coordinator.data[sensor_type]
+        return attrs
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state and notify forecast subscribers if the forecast changed."""
+        super()._handle_coordinator_update()
+        if self.coordinator.forecast_revision == self._revision:
+            return
+
+        self._revision = self.coordinator.forecast_revision
+        self._forecasts = {}
+        self.hass.async_create_task(self.async_update_listeners(("hourly", "daily")))
+
+    async def async_update(self) -> None:
+        """Count an update_entity call as a read; the scheduler fetches."""
+        self.coordinator.async_mark_viewed()
+
+    @callback
+    def _async_subscription_started(
+        self, forecast_type: Literal["daily", "hourly", "twice_daily"]
+    ) -> None:
+        """Count a watched forecast towards the location's refresh priority."""
+        self.coordinator.viewers += 1
+
+    @callback
+    def _async_subscription_ended(
+        self, forecast_type: Literal["daily", "hourly", "twice_daily"]
+    ) -> None:
+        """Stop counting a forecast that is no longer watched."""
+        self.coordinator.viewers -= 1
+        self.coordinator.async_mark_viewed()
+
+    def _cached_forecast(self, forecast_type: str) -> list[Forecast] | None:
+        """Return a forecast, serializing it only once per revision."""
+        data = self.coordinator.data
+        if not data or "hourly" not in data:
+            return None
+
+        if forecast_type not in self._forecasts:
+            if forecast_type == "hourly":
+                forecast = [
+                    _with_forecast_fields(row, HOURLY_FORECAST_FIELDS)
+                    for row in serialize_hourly(
+                        data["hourly"], dt_util.get_time_zone(self.hass.config.time_zone)
+                    )
+                ]
+            else:
+                # Days start at the location's midnight, as they were cut
+                tz = self.coordinator.location_time_zone
+                forecast = [
+                    _with_forecast_fields(
+                        {
+                            **day,
+                            "datetime": datetime.combine(
+                                date.fromisoformat(day["date"]), time.min, tz
+                            ).isoformat(),
+                        },
+                        DAILY_FORECAST_FIELDS,
+                    )
+                    for day in data.get("daily", [])
+                ]
+            self._forecasts[forecast_type] = forecast
+        return self._forecasts[forecast_type]
+
+    async def async_forecast_hourly(self) -> list[Forecast] | None:
+        """Return the hourly forecast."""
+        return self._cached_forecast("hourly")
+
+    async def async_forecast_daily(self) -> list[Forecast] | None:
+        """Return the daily summaries as a daily forecast."""
+        return self._cached_forecast("daily")
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Open Meteo Marine API.
+Serves recorded fixtures (or synthesized payloads) over HTTP so the
+integration and the test scripts can run without network access.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from urllib.parse import parse_qs, urlsplit
+
+from script_helpers import load_component_module
+
+transport_module = load_component_module("transport")
+
+
+class ReplayServer:
+    """Minimal HTTP/1.1 server answering API requests from a replay transport."""
+
+    def __init__(self, transport):
+        """Initialize with the replay transport serving responses."""
+        self.transport = transport
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve requests on one connection until the client closes it."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                _, target, _ = request_line.decode("latin-1").split(" ", 2)
+                status, body = await self.respond(target)
+                keep_alive = headers.get("connection", "").lower() != "close"
+
+                writer.write(
+                    f"HTTP/1.1 {status}\r\n"
+                    "Content-Type: application/json\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+                    "\r\n".encode()
+                    + body
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, target: str):
+        """Return the status line and body for a request target."""
+        query = parse_qs(urlsplit(target).query)
+        params = {key: ",".join(values) for key, values in query.items()}
+        if "latitude" not in params or "longitude" not in params:
+            return "400 Bad Request", b'{"error": true, "reason": "Missing coordinates"}'
+
+        try:
+            return "200 OK", await self.transport.async_get(params)
+        except transport_module.MissingFixtureError as err:
+            return "404 Not Found", json.dumps({"error": True, "reason": str(err)}).encode()
+        except transport_module.MarineTransportError as err:
+            return (
+                "500 Internal Server Error",
+                json.dumps({"error": True, "reason": str(err)}).encode(),
+            )
+
+
+async def serve(args):
+    """Run the replay server until interrupted."""
+    transport = transport_module.ReplayTransport(
+        args.fixtures,
+        synthesize=args.synthesize,
+        latency=args.latency / 1000,
+        jitter=args.jitter / 1000,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    server = ReplayServer(transport)
+    listener = await asyncio.start_server(server.handle, args.host, args.port)
+
+    print(f"🌊 Replay server listening on http://{args.host}:{args.port}/v1/marine")
+    print(f"📁 Fixtures: {args.fixtures or 'none'} | Synthesize: {args.synthesize}")
+    async with listener:
+        await listener.serve_forever()
+
+
+def main():
+    """Parse arguments and start the server."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fixtures", help="Directory of recorded fixtures")
+    parser.add_argument(
+        "--synthesize",
+        action="store_true",
+        help="Answer requests without a fixture with a synthesized payload",
+    )
+    parser.add_argument("--latency", type=float, default=0.0, help="Added latency (ms)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random extra latency (ms)")
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="Fraction of requests answered with 500"
+    )
+    parser.add_argument("--seed", type=int, help="Seed for jitter and error injection")
+    args = parser.parse_args()
+
+    if not args.fixtures and not args.synthesize:
+        parser.error("Provide --fixtures and/or --synthesize")
+
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        print("\n👋 Replay server stopped")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
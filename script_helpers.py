@@ -0,0 +1,29 @@
+"""
+Helpers shared by the standalone scripts in the repository root.
+The component's const and transport modules have no Home Assistant
+imports, so they are loaded straight from their files here.
+"""
+
+import importlib.util
+import math
+from pathlib import Path
+from typing import List
+
+COMPONENT_DIR = Path(__file__).parent / "custom_components" / "openmeteo_marine"
+
+
+def load_component_module(name: str):
+    """Load one of the component's Home Assistant-free modules."""
+    spec = importlib.util.spec_from_file_location(
+        f"openmeteo_marine_{name}", COMPONENT_DIR / f"{name}.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Return a percentile of the samples using nearest-rank."""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
@@ -2,24 +2,34 @@
 """
 Quick test script for Open Meteo Marine API integration.
 This script tests the API functionality without requiring Home Assistant.
+
+Run "python test_marine_api.py load locations.txt" to load test many
+locations with configurable concurrency, batching and connection reuse.
 """
 
+import argparse
 import asyncio
-import httpx
 import json
+import time
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
+
+from script_helpers import load_component_module, percentile
+
+const = load_component_module("const")
+API_BASE_URL = const.API_BASE_URL
+CURRENT_VARIABLES = const.CURRENT_VARIABLES
 
 
 class TestOpenMeteoMarine:
     """Test class for Open Meteo Marine API."""
     
-    def __init__(self, latitude: float, longitude: float):
-        """Initialize with coordinates."""
+    def __init__(self, latitude: float, longitude: float, transport, api_base_url: str = API_BASE_URL):
+        """Initialize with coordinates and the transport to query."""
         self.latitude = latitude
         self.longitude = longitude
-        self.api_base_url = "https://marine-api.open-meteo.com/v1/marine"
-        self._client = httpx.AsyncClient(timeout=30.0)
+        self.api_base_url = api_base_url
+        self._transport = transport
 
     async def fetch_marine_data(self) -> Dict[str, Any]:
         """Fetch marine data from Open Meteo API."""
@@ -43,11 +53,10 @@ class TestOpenMeteoMarine:
             print(f"📋 Parameters: {json.dumps(params, indent=2)}")
             print("=" * 50)
             
-            response = await self._client.get(self.api_base_url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            body = await self._transport.async_get(params)
+            data = json.loads(body)
 
-            print(f"✅ API Response Status: {response.status_code}")
+            print(f"✅ API Response: {len(body)} bytes")
             print(f"📊 Raw API Response:")
             print(json.dumps(data, indent=2))
             print("=" * 50)
@@ -83,16 +92,12 @@ class TestOpenMeteoMarine:
             
             return parsed_data
 
-        except httpx.RequestError as err:
-            raise Exception(f"Error requesting data: {err}") from err
-        except httpx.HTTPStatusError as err:
-            raise Exception(f"HTTP error occurred: {err}") from err
         except Exception as err:
             raise Exception(f"Unexpected error: {err}") from err
 
     async def close(self):
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Close the transport."""
+        await self._transport.async_close()
 
     def format_results(self, data: Dict[str, Any]) -> str:
         """Format the results for display."""
@@ -121,12 +126,22 @@ class TestOpenMeteoMarine:
         return result
 
 
-async def test_coordinates(latitude: float, longitude: float):
+def build_transport(args):
+    """Return the transport selected on the command line."""
+    transport_module = load_component_module("transport")
+    transport = transport_module.HttpxTransport(args.base_url)
+    if args.record:
+        print(f"💾 Recording responses to {args.record}")
+        transport = transport_module.RecordingTransport(transport, args.record)
+    return transport
+
+
+async def test_coordinates(latitude: float, longitude: float, args):
     """Test a specific set of coordinates."""
     print(f"\n🚀 Testing coordinates: {latitude}, {longitude}")
     print("=" * 60)
     
-    tester = TestOpenMeteoMarine(latitude, longitude)
+    tester = TestOpenMeteoMarine(latitude, longitude, build_transport(args), args.base_url)
     
     try:
         data = await tester.fetch_marine_data()
@@ -141,7 +156,7 @@ async def test_coordinates(latitude: float, longitude: float):
         await tester.close()
 
 
-async def main():
+async def main(args):
     """Main test function."""
     print("🧪 Open Meteo Marine API Test Script")
     print("=" * 60)
@@ -158,7 +173,7 @@ async def main():
     print(f"🌊 Testing {len(test_locations)} marine locations...")
     
     for lat, lon in test_locations:
-        await test_coordinates(lat, lon)
+        await test_coordinates(lat, lon, args)
         print("\n" + "="*60)
     
     # Interactive test
@@ -174,7 +189,7 @@ async def main():
             lon = float(lon_input)
             
             if -90 <= lat <= 90 and -180 <= lon <= 180:
-                await test_coordinates(lat, lon)
+                await test_coordinates(lat, lon, args)
             else:
                 print("❌ Invalid coordinates! Latitude must be -90 to 90, longitude -180 to 180")
     
@@ -184,6 +199,190 @@ async def main():
     print("\n✅ Test completed!")
 
 
+def read_locations(path: str) -> List[Tuple[float, float]]:
+    """Read "latitude,longitude" lines from a file, skipping comments."""
+    locations = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            try:
+                lat, lon = (float(value) for value in line.split(",")[:2])
+            except ValueError as err:
+                raise ValueError(f"{path}:{line_number}: expected 'latitude,longitude'") from err
+            if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+                raise ValueError(f"{path}:{line_number}: coordinates out of range")
+            locations.append((lat, lon))
+    return locations
+
+
+def positive_int(value: str) -> int:
+    """Parse a command line value that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def non_negative_int(value: str) -> int:
+    """Parse a command line value that must be at least 0."""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be at least 0, got {number}")
+    return number
+
+
+class LoadTestResult:
+    """Accumulate per-request measurements of a load test."""
+
+    def __init__(self):
+        """Initialize empty counters."""
+        self.latencies: List[float] = []
+        self.errors: Dict[str, int] = {}
+        self.requests = 0
+        self.locations = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.duration = 0.0
+
+    def add(self, latency: float, locations: int, sent: int, received: int, error: str = None):
+        """Record one finished request."""
+        self.requests += 1
+        self.latencies.append(latency)
+        self.bytes_sent += sent
+        self.bytes_received += received
+        if error:
+            self.errors[error] = self.errors.get(error, 0) + 1
+        else:
+            self.locations += locations
+
+    def summary(self) -> Dict[str, Any]:
+        """Return the results as a JSON-serializable dict."""
+        millis = [latency * 1000 for latency in self.latencies] or [0.0]
+        failed = sum(self.errors.values())
+        return {
+            "requests": self.requests,
+            "locations_served": self.locations,
+            "duration_s": round(self.duration, 3),
+            "requests_per_s": round(self.requests / self.duration, 2) if self.duration else 0.0,
+            "locations_per_s": round(self.locations / self.duration, 2) if self.duration else 0.0,
+            "latency_ms": {
+                "p50": round(percentile(millis, 0.50), 2),
+                "p90": round(percentile(millis, 0.90), 2),
+                "p95": round(percentile(millis, 0.95), 2),
+                "p99": round(percentile(millis, 0.99), 2),
+                "max": round(max(millis), 2),
+            },
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "error_rate": round(failed / self.requests, 4) if self.requests else 0.0,
+            "errors": self.errors,
+        }
+
+
+async def run_load_test(args) -> Dict[str, Any]:
+    """Fetch every location with the requested concurrency and batching."""
+    import httpx
+
+    locations = read_locations(args.locations)
+    batches = [
+        locations[start : start + args.batch_size]
+        for start in range(0, len(locations), args.batch_size)
+    ] * args.iterations
+
+    queue: asyncio.Queue = asyncio.Queue()
+    for batch in batches:
+        queue.put_nowait(batch)
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    shared_client = httpx.AsyncClient(timeout=args.timeout, limits=limits) if args.reuse else None
+    result = LoadTestResult()
+
+    async def fetch(client: "httpx.AsyncClient", batch: List[Tuple[float, float]]):
+        params = {
+            "latitude": ",".join(str(lat) for lat, _ in batch),
+            "longitude": ",".join(str(lon) for _, lon in batch),
+            "current": ",".join(CURRENT_VARIABLES),
+            "timezone": "auto",
+        }
+        if args.forecast_days:
+            params["hourly"] = ",".join(CURRENT_VARIABLES)
+            params["forecast_days"] = args.forecast_days
+
+        started = time.perf_counter()
+        sent = received = 0
+        error = None
+        try:
+            request = client.build_request("GET", args.base_url, params=params)
+            sent = len(str(request.url)) + sum(len(k) + len(v) for k, v in request.headers.raw)
+            response = await client.send(request)
+            received = response.num_bytes_downloaded
+            response.raise_for_status()
+            data = response.json()
+            returned = len(data) if isinstance(data, list) else 1
+            if returned != len(batch):
+                error = "location_count_mismatch"
+        except httpx.HTTPStatusError as err:
+            error = f"http_{err.response.status_code}"
+        except httpx.RequestError as err:
+            error = type(err).__name__
+        except ValueError:
+            error = "invalid_json"
+        result.add(time.perf_counter() - started, len(batch), sent, received, error)
+
+    async def worker():
+        while not queue.empty():
+            batch = queue.get_nowait()
+            if shared_client is not None:
+                await fetch(shared_client, batch)
+            else:
+                async with httpx.AsyncClient(timeout=args.timeout) as client:
+                    await fetch(client, batch)
+
+    print(
+        f"🚀 {len(locations)} locations x {args.iterations} iterations, "
+        f"{len(batches)} requests, concurrency {args.concurrency}, batch size {args.batch_size}, "
+        f"connection reuse {'on' if args.reuse else 'off'}"
+    )
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    finally:
+        if shared_client is not None:
+            await shared_client.aclose()
+    result.duration = time.perf_counter() - started
+    return result.summary()
+
+
+def format_load_results(summary: Dict[str, Any]) -> str:
+    """Format load test results for display."""
+    latency = summary["latency_ms"]
+    result = "📈 LOAD TEST RESULTS\n"
+    result += "=" * 30 + "\n"
+    result += f"Requests: {summary['requests']} in {summary['duration_s']} s\n"
+    result += f"Throughput: {summary['requests_per_s']} req/s, {summary['locations_per_s']} locations/s\n"
+    result += (
+        f"Latency (ms): p50 {latency['p50']} | p90 {latency['p90']} | "
+        f"p95 {latency['p95']} | p99 {latency['p99']} | max {latency['max']}\n"
+    )
+    result += f"Transferred: {summary['bytes_sent']} B sent, {summary['bytes_received']} B received\n"
+    result += f"Error rate: {summary['error_rate'] * 100:.2f}%\n"
+    for error, count in summary["errors"].items():
+        result += f"  ❌ {error}: {count}\n"
+    return result
+
+
+async def load_test(args):
+    """Run the load test and report the results."""
+    summary = await run_load_test(args)
+    print("\n" + format_load_results(summary))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+        print(f"💾 Results written to {args.json}")
+
+
 if __name__ == "__main__":
     # Install required package if not available
     try:
@@ -192,4 +391,38 @@ if __name__ == "__main__":
         print("❌ httpx not found. Install it with: pip install httpx")
         exit(1)
     
-    asyncio.run(main())
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Test the Open Meteo Marine API")
+    parser.add_argument(
+        "--base-url",
+        default=API_BASE_URL,
+        help="API endpoint, e.g. a local replay_server.py instance",
+    )
+    parser.add_argument(
+        "--record", help="Save every response as a fixture in this directory (not with load)"
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    load_parser = subparsers.add_parser("load", help="Load test many locations concurrently")
+    load_parser.add_argument("locations", help="File with one 'latitude,longitude' per line")
+    load_parser.add_argument("-c", "--concurrency", type=positive_int, default=4, help="Requests in flight")
+    load_parser.add_argument("-b", "--batch-size", type=positive_int, default=1, help="Locations per request")
+    load_parser.add_argument("-n", "--iterations", type=positive_int, default=1, help="Passes over the file")
+    load_parser.add_argument(
+        "--no-reuse",
+        dest="reuse",
+        action="store_false",
+        help="Open a new connection for every request",
+    )
+    load_parser.add_argument(
+        "--forecast-days", type=non_negative_int, default=0, help="Also request hourly data for N days"
+    )
+    load_parser.add_argument("--timeout", type=float, default=30.0, help="Request timeout (s)")
+    load_parser.add_argument("--json", help="Write the results as JSON to this file")
+
+    args = parser.parse_args()
+    if args.command == "load":
+        if args.record:
+            parser.error("--record is not supported with the load command")
+        asyncio.run(load_test(args))
+    else:
+        asyncio.run(main(args))
\ No newline at end of file
@@ -38,6 +38,11 @@ async def test_form(hass: HomeAssistant) -> None:
         CONF_LATITUDE: 40.7128,
         CONF_LONGITUDE: -74.0060,
         "update_interval": 60,
+        "grid_mode": False,
+        "forecast_days": 0,
+        "unixtime": False,
+        "models": [],
+        "priority": "normal",
     }
 
 
@@ -57,4 +62,24 @@ async def test_form_invalid_latitude(hass: HomeAssistant) -> None:
     )
 
     assert result2["type"] == data_entry_flow.RESULT_TYPE_FORM
-    assert result2["errors"] == {"base": "invalid_latitude"}
\ No newline at end of file
+    assert result2["errors"] == {"base": "invalid_latitude"}
+
+
+async def test_form_grid_mode_forecast(hass: HomeAssistant) -> None:
+    """Test forecast days are rejected for grid locations."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+
+    result2 = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {
+            CONF_LATITUDE: 40.7128,
+            CONF_LONGITUDE: -74.0060,
+            "grid_mode": True,
+            "forecast_days": 3,
+        },
+    )
+
+    assert result2["type"] == data_entry_flow.RESULT_TYPE_FORM
+    assert result2["errors"] == {"base": "grid_mode_forecast"}
\ No newline at end of file
@@ -0,0 +1,69 @@
+"""Test the Open Meteo Marine ensemble statistics."""
+import pytest
+
+from custom_components.openmeteo_marine.ensemble import (
+    combine,
+    confidence,
+    merge_current,
+    merge_hourly,
+)
+
+MODELS = ["ecmwf_wam025", "gwam"]
+
+
+def test_combine_scalar() -> None:
+    """Test mean, spread and agreement of scalar values."""
+    mean, spread, agreement = combine([1.0, 3.0], directional=False)
+
+    assert mean == 2.0
+    assert spread == 1.0
+    assert agreement == 0.5
+
+
+def test_combine_directional() -> None:
+    """Test directions are averaged across north."""
+    mean, spread, agreement = combine([350.0, 10.0], directional=True)
+
+    assert mean == pytest.approx(0.0, abs=1e-9) or mean == pytest.approx(360.0)
+    assert spread == pytest.approx(10.0, rel=0.01)
+    assert agreement == pytest.approx(0.985, abs=0.001)
+
+
+def test_merge_current() -> None:
+    """Test suffixed model values merge into plain variable names."""
+    current = {
+        "time": "2024-01-01T00:00",
+        "wave_height_ecmwf_wam025": 1.0,
+        "wave_height_gwam": 1.4,
+        "sea_surface_temperature_ecmwf_wam025": None,
+        "sea_surface_temperature_gwam": 18.0,
+    }
+
+    merged, stats = merge_current(
+        current, ["wave_height", "sea_surface_temperature"], MODELS, set()
+    )
+
+    assert merged == {
+        "time": "2024-01-01T00:00",
+        "wave_height": 1.2,
+        "sea_surface_temperature": 18.0,
+    }
+    # Only variables reported by several models are compared
+    assert list(stats) == ["wave_height"]
+    assert stats["wave_height"]["spread"] == 0.2
+    assert stats["wave_height"]["models"] == {"ecmwf_wam025": 1.0, "gwam": 1.4}
+    assert confidence(stats) == pytest.approx(83.3)
+    assert confidence({}) is None
+
+
+def test_merge_hourly() -> None:
+    """Test hourly model columns merge into one mean column."""
+    hourly = {
+        "time": [0, 3600],
+        "wave_direction_ecmwf_wam025": [90.0, None],
+        "wave_direction_gwam": [180.0, 270.0],
+    }
+
+    merged = merge_hourly(hourly, ["wave_direction"], MODELS, {"wave_direction"})
+
+    assert merged == {"time": [0, 3600], "wave_direction": [135.0, 270.0]}
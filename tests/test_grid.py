@@ -0,0 +1,120 @@
+"""Test the Open Meteo Marine grid interpolation."""
+import json
+from datetime import timedelta
+from typing import Any
+
+import pytest
+
+from custom_components.openmeteo_marine.grid import GridPlan, MarineGrid, grid_corners
+from custom_components.openmeteo_marine.transport import MarineTransport, canonical_params
+
+SEA_FROM_LONGITUDE = 151.5
+
+
+class CoastTransport(MarineTransport):
+    """Answer grid requests for a coast with land west of 151.5°E."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.requests: list[int] = []
+
+    async def async_get(self, params: dict[str, Any]) -> bytes:
+        """Return current data for the sea points and nothing for land."""
+        query = canonical_params(params)
+        points = list(
+            zip(
+                (float(value) for value in query["latitude"].split(",")),
+                (float(value) for value in query["longitude"].split(",")),
+            )
+        )
+        self.requests.append(len(points))
+        results = [
+            {"current": {"time": 1704067200, "wave_height": abs(latitude)}}
+            if longitude >= SEA_FROM_LONGITUDE
+            else {}
+            for latitude, longitude in points
+        ]
+        return json.dumps(results if len(results) > 1 else results[0]).encode()
+
+
+def test_grid_corners() -> None:
+    """Test a location is surrounded by its four grid points."""
+    assert grid_corners(-33.89, 151.27, 0.25) == [
+        (-34.0, 151.25),
+        (-34.0, 151.5),
+        (-33.75, 151.25),
+        (-33.75, 151.5),
+    ]
+
+
+def test_nearby_locations_share_grid_points() -> None:
+    """Test locations in the same cell reuse the same fetched points."""
+    plan = GridPlan([(-33.89, 151.27), (-33.80, 151.30)], 0.25)
+
+    assert len(plan.nodes) == 4
+    for _, weights in plan.stencils:
+        assert sum(weights) == pytest.approx(1.0)
+
+
+def test_interpolate_ignores_land_points() -> None:
+    """Test grid points without data get no weight."""
+    plan = GridPlan([(-33.875, 151.375)], 0.25)
+
+    result = plan.interpolate(
+        {"wave_height": [1.0, None, 3.0, None]}, directional=set()
+    )
+
+    assert result == [{"wave_height": 2.0}]
+
+
+def test_interpolate_directions_on_circle() -> None:
+    """Test directions either side of north average to north."""
+    plan = GridPlan([(-33.875, 151.375)], 0.25)
+
+    result = plan.interpolate(
+        {"wave_direction": [350.0, 10.0, 350.0, 10.0]},
+        directional={"wave_direction"},
+    )
+
+    assert result[0]["wave_direction"] in (0.0, 360.0)
+
+
+def test_interpolate_falls_back_to_nearest_sea_point() -> None:
+    """Test a location in an all-land cell takes its nearest fallback value."""
+    plan = GridPlan([(-33.9, 151.1)], 0.25)
+    plan.widen(0)
+    column: list[float | None] = [None] * len(plan.nodes)
+    for index, (latitude, longitude) in enumerate(plan.nodes):
+        if longitude >= SEA_FROM_LONGITUDE:
+            column[index] = abs(latitude)
+
+    assert plan.interpolate({"wave_height": column}, directional=set()) == [
+        {"wave_height": 34.0}
+    ]
+
+
+async def test_grid_refresh_and_reuse() -> None:
+    """Test the grid fetches once, interpolates and serves its snapshot."""
+    transport = CoastTransport()
+    grid = MarineGrid(0.25, transport)
+    grid.register(-33.875, 151.375)
+    grid.register(-33.9, 151.1)
+
+    coast = await grid.async_get(-33.875, 151.375, max_age=timedelta(minutes=5))
+    harbour = await grid.async_get(-33.9, 151.1, max_age=timedelta(minutes=5))
+
+    # The coastal cell has sea to the east; the harbour cell is all land
+    assert coast["wave_height"] == pytest.approx(33.875)
+    assert harbour["wave_height"] == 34.0
+    assert harbour["time"] == 1704067200
+    # One request for the cells, one more for the harbour's fallback ring
+    assert len(transport.requests) == 2
+
+    await grid.async_get(-33.9, 151.1, max_age=timedelta(minutes=5))
+    assert len(transport.requests) == 2
+
+    await grid.async_get(-33.9, 151.1, max_age=timedelta(0))
+    assert len(transport.requests) == 3
+    assert (await grid.async_get(-33.9, 151.1, max_age=timedelta(minutes=5)))[
+        "wave_height"
+    ] == 34.0
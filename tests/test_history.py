@@ -0,0 +1,33 @@
+"""Test the Open Meteo Marine rolling history."""
+import pytest
+
+from custom_components.openmeteo_marine.history import MarineHistory, RollingSeries
+
+START = 1704067200
+HOUR = 3600
+
+
+def test_rolling_statistics() -> None:
+    """Test trend, rate of change and extremes over a full window."""
+    series = RollingSeries(3)
+    for hour, value in enumerate([5.0, 1.0, 2.0, 3.0]):
+        series.push(START + hour * HOUR, value)
+
+    # The first value has been evicted from the window
+    assert len(series) == 3
+    assert series.minimum == 1.0
+    assert series.maximum == 3.0
+    assert series.trend == pytest.approx(1.0)
+    assert series.rate_of_change == pytest.approx(1.0)
+    assert series.span_hours == pytest.approx(2.0)
+
+
+def test_history_ignores_repeated_snapshots() -> None:
+    """Test a snapshot with an unchanged timestamp is not added twice."""
+    history = MarineHistory(["wave_height"], 48)
+
+    assert history.add(START, {"wave_height": 1.0})
+    assert not history.add(START, {"wave_height": 1.0})
+    assert history.add(START + HOUR, {"wave_height": None})
+
+    assert len(history.series["wave_height"]) == 1
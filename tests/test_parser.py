@@ -0,0 +1,55 @@
+"""Test the Open Meteo Marine response parsing."""
+import math
+from datetime import datetime, timedelta, timezone
+
+from custom_components.openmeteo_marine.parser import (
+    json_loads,
+    parse_current,
+    parse_hourly,
+    response_timezone,
+)
+
+
+def test_parse_current() -> None:
+    """Test API variables are mapped onto sensor keys."""
+    assert parse_current(
+        {"time": "2024-01-01T00:00", "wave_height": 1.2, "ocean_current_velocity": 0.4}
+    ) == {"wave_height": 1.2, "current_velocity": 0.4}
+
+
+def test_parse_hourly_time_formats_agree() -> None:
+    """Test ISO local times and unixtime give the same epoch column."""
+    iso = parse_hourly(
+        {
+            "time": ["2024-01-01T11:00", "2024-01-01T12:00"],
+            "wave_height": [1.0, None],
+        },
+        timezone(timedelta(hours=11)),
+    )
+    unix = parse_hourly(
+        {"time": [1704067200, 1704070800], "wave_height": [1.0, None]}
+    )
+
+    assert list(iso.times) == list(unix.times) == [1704067200, 1704070800]
+    assert iso.values["wave_height"][0] == 1.0
+    assert math.isnan(unix.values["wave_height"][1])
+    assert unix.datetimes(timezone.utc)[0].hour == 0
+
+
+def test_parse_hourly_across_dst() -> None:
+    """Test one offset applies to the whole series, as the API shifts it."""
+    tz = response_timezone({"timezone": "Australia/Sydney", "utc_offset_seconds": 39600})
+    iso = parse_hourly({"time": ["2024-04-06T12:00", "2024-04-07T12:00"]}, tz)
+    unix = parse_hourly({"time": [1712365200, 1712451600]}, tz)
+
+    # Sydney leaves daylight saving time in between, the series does not
+    assert list(iso.times) == list(unix.times)
+    assert iso.times[1] - iso.times[0] == 24 * 3600
+    assert iso.datetimes(timezone.utc)[1] == datetime(2024, 4, 7, 1, tzinfo=timezone.utc)
+
+
+def test_json_loads() -> None:
+    """Test response bodies are decoded."""
+    assert json_loads(b'{"current": {"wave_height": 1.5}}') == {
+        "current": {"wave_height": 1.5}
+    }
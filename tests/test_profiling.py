@@ -0,0 +1,35 @@
+"""Test the Open Meteo Marine profiling hooks."""
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.openmeteo_marine.profiling import MarineProfiler
+
+
+async def test_profile_session_writes_results(hass: HomeAssistant, tmp_path) -> None:
+    """Test a profiling session writes stats to the config directory."""
+    hass.config.config_dir = str(tmp_path)
+    profiler = MarineProfiler(hass)
+
+    profiler.async_start(60, use_cprofile=True, use_tracemalloc=True)
+    with profiler.span("parse"), profiler.profile():
+        sorted(range(1000), reverse=True)
+    paths = await profiler.async_stop()
+
+    assert not profiler.active
+    assert sorted(Path(path).suffix for path in paths) == [".prof", ".txt"]
+    assert "parse: 1 calls" in Path(paths[-1]).read_text(encoding="utf-8")
+
+
+async def test_timing_spans_toggle(hass: HomeAssistant) -> None:
+    """Test timing spans are only recorded while switched on."""
+    profiler = MarineProfiler(hass)
+
+    with profiler.span("fetch"):
+        pass
+    assert profiler.timings == {}
+
+    profiler.async_set_timing(True)
+    with profiler.span("fetch"):
+        pass
+    assert profiler.timings["fetch"].count == 1
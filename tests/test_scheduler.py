@@ -0,0 +1,133 @@
+"""Test the Open Meteo Marine refresh scheduler."""
+import math
+from datetime import timedelta
+from typing import Any
+
+import pytest
+from homeassistant.const import CONF_LATITUDE, CONF_LONGITUDE
+from homeassistant.core import HomeAssistant
+
+from custom_components.openmeteo_marine.const import (
+    SCHEDULER_BURST,
+    SCHEDULER_REQUEST_BUDGET,
+    SCHEDULER_RETRY,
+)
+from custom_components.openmeteo_marine.coordinator import (
+    OpenMeteoMarineDataUpdateCoordinator,
+)
+from custom_components.openmeteo_marine.scheduler import MarineScheduler, plan_batches
+from custom_components.openmeteo_marine.transport import ReplayTransport
+
+
+def test_plan_batches_by_score() -> None:
+    """Test the budget goes to the highest scoring batches first."""
+    candidates = [
+        (1.2, "a", "low"),
+        (3.0, "b", "high"),
+        (2.0, "c", "medium"),
+    ]
+
+    assert plan_batches(candidates, budget=2, batch_size=10) == [["high"], ["medium"]]
+    assert plan_batches(candidates, budget=0, batch_size=10) == []
+
+
+def test_plan_batches_shares_requests() -> None:
+    """Test due locations with the same query share a request up to the batch size."""
+    candidates = [(1.5, "a", index) for index in range(5)]
+
+    assert plan_batches(candidates, budget=1, batch_size=3) == [[0, 1, 2]]
+    assert plan_batches(candidates, budget=5, batch_size=3) == [[0, 1, 2], [3, 4]]
+
+
+def test_plan_batches_ride_along() -> None:
+    """Test locations that are not due fill spare slots of outgoing batches."""
+    candidates = [
+        (2.0, "a", "due"),
+        (0.7, "a", "rider"),
+        (0.3, "a", "fresh"),
+        (0.9, "b", "no batch"),
+    ]
+
+    assert plan_batches(candidates, budget=5, batch_size=10, ride_along=0.5) == [
+        ["due", "rider"]
+    ]
+
+
+def _coordinator(hass: HomeAssistant, transport: ReplayTransport, **config: Any):
+    """Return a scheduled coordinator for a location."""
+    return OpenMeteoMarineDataUpdateCoordinator(
+        hass,
+        {CONF_LATITUDE: -33.9, CONF_LONGITUDE: 151.3, **config},
+        timedelta(minutes=60),
+        transport=transport,
+        scheduled=True,
+    )
+
+
+async def test_score(hass: HomeAssistant) -> None:
+    """Test urgency grows with staleness and the multipliers, above a floor."""
+    scheduler = MarineScheduler(hass, ReplayTransport(synthesize=True))
+    coordinator = _coordinator(hass, scheduler._transport)
+    assert scheduler.score(coordinator, 0.0) == math.inf
+
+    coordinator.last_fetch = 0.0
+    assert scheduler.score(coordinator, 3600.0) == pytest.approx(1.0)
+    assert scheduler.score(coordinator, 2700.0) == pytest.approx(0.75)
+
+    coordinator.priority = "high"
+    coordinator.viewers = 1
+    assert scheduler.score(coordinator, 1800.0) == pytest.approx(2.0)
+    # Even watched high priority locations wait half their interval
+    assert scheduler.score(coordinator, 1790.0) == 0.0
+
+
+async def test_token_bucket(hass: HomeAssistant) -> None:
+    """Test refreshes are limited by the burst size and the hourly budget."""
+    transport = ReplayTransport(synthesize=True)
+    scheduler = MarineScheduler(hass, transport)
+    # Different forecast lengths cannot share a request
+    for days in range(SCHEDULER_BURST + 5):
+        scheduler.register(_coordinator(hass, transport, forecast_days=days))
+
+    await scheduler._async_tick()
+    assert transport.requests == SCHEDULER_BURST
+
+    await scheduler._async_tick()
+    assert transport.requests == SCHEDULER_BURST
+
+    # Two requests' worth of budget accrues in the meantime
+    scheduler._refilled -= 2 * 3600 / SCHEDULER_REQUEST_BUDGET
+    await scheduler._async_tick()
+    assert transport.requests == SCHEDULER_BURST + 2
+
+    for coordinator in list(scheduler._coordinators):
+        scheduler.unregister(coordinator)
+
+
+async def test_failed_batch_backs_off(hass: HomeAssistant) -> None:
+    """Test locations whose refresh failed are retried with exponential backoff."""
+    transport = ReplayTransport(synthesize=True, error_rate=1.0)
+    scheduler = MarineScheduler(hass, transport)
+    coordinators = [_coordinator(hass, transport) for _ in range(2)]
+
+    await scheduler._async_refresh_batch(coordinators)
+
+    for coordinator in coordinators:
+        assert not coordinator.last_update_success
+        assert coordinator.failures == 1
+        assert coordinator.last_fetch is None
+        started = coordinator.last_attempt
+        assert scheduler.score(coordinator, started + SCHEDULER_RETRY / 2) == pytest.approx(0.5)
+        assert scheduler.score(coordinator, started + SCHEDULER_RETRY) == pytest.approx(1.0)
+
+    await coordinators[0].async_refresh()
+    coordinator = coordinators[0]
+    assert coordinator.failures == 2
+    assert scheduler.score(
+        coordinator, coordinator.last_attempt + SCHEDULER_RETRY
+    ) == pytest.approx(0.5)
+
+    transport.error_rate = 0.0
+    await coordinator.async_refresh()
+    assert coordinator.failures == 0
+    assert coordinator.last_fetch == coordinator.last_attempt
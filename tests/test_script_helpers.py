@@ -0,0 +1,11 @@
+"""Test the helpers shared by the benchmark and load test scripts."""
+from script_helpers import percentile
+
+
+def test_percentile_nearest_rank() -> None:
+    """Test percentiles pick the nearest-rank sample, rounding the rank up."""
+    assert percentile([5, 1, 4, 2, 3], 0.5) == 3
+    assert percentile([1, 2, 3, 4, 5], 0.9) == 5
+    assert percentile(list(range(1, 31)), 0.95) == 29
+    assert percentile([1, 2, 3], 0.0) == 1
+    assert percentile([1, 2, 3], 1.0) == 3
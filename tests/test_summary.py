@@ -0,0 +1,110 @@
+"""Test the Open Meteo Marine daily summaries."""
+import json
+from array import array
+from datetime import timedelta, timezone
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.const import CONF_LATITUDE, CONF_LONGITUDE
+from homeassistant.core import HomeAssistant
+
+from custom_components.openmeteo_marine.coordinator import (
+    OpenMeteoMarineDataUpdateCoordinator,
+)
+from custom_components.openmeteo_marine.parser import MarineColumns
+from custom_components.openmeteo_marine.summary import daily_aggregates
+from custom_components.openmeteo_marine.transport import MarineTransport
+
+MIDNIGHT = 1704067200  # 2024-01-01T00:00:00Z
+HOUR = 3600
+
+
+def test_daily_aggregates() -> None:
+    """Test hours are grouped per local day and aggregated."""
+    columns = MarineColumns(
+        array("q", [MIDNIGHT + offset * HOUR for offset in (0, 12, 24, 36)]),
+        {
+            "wave_height": array("d", [1.0, 3.0, 2.0, float("nan")]),
+            "wave_direction": array("d", [350.0, 10.0, 90.0, 90.0]),
+        },
+    )
+
+    days = daily_aggregates(columns, timezone.utc, {"wave_direction"})
+
+    assert [day["date"] for day in days] == ["2024-01-01", "2024-01-02"]
+    assert days[0]["wave_height_max"] == 3.0
+    assert days[0]["wave_height_min"] == 1.0
+    assert days[0]["wave_height_mean"] == 2.0
+    assert days[0]["wave_direction_mean"] in (0.0, 360.0)
+    assert days[1]["wave_height_mean"] == 2.0
+    assert days[1]["wave_direction_mean"] == 90.0
+
+
+class _StaticTransport(MarineTransport):
+    """Answer every request with the same body."""
+
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+
+    async def async_get(self, params: dict[str, Any]) -> bytes:
+        return self.body
+
+
+async def test_days_follow_location_time_zone(hass: HomeAssistant, freezer) -> None:
+    """Test days are cut at the location's midnight, not Home Assistant's."""
+    hours = [f"2024-01-0{day}T{hour:02d}:00" for day in (1, 2) for hour in range(24)]
+    body = json.dumps(
+        {
+            "timezone": "Pacific/Auckland",
+            "utc_offset_seconds": 46800,
+            "current": {"time": "2024-01-02T09:00", "wave_height": 2.0},
+            "hourly": {"time": hours, "wave_height": [1.0] * 24 + [2.0] * 24},
+        }
+    ).encode()
+    # 09:00 on January 2nd in Auckland, still January 1st in Home Assistant
+    freezer.move_to("2024-01-01T20:00:00+00:00")
+    coordinator = OpenMeteoMarineDataUpdateCoordinator(
+        hass,
+        {CONF_LATITUDE: -36.8, CONF_LONGITUDE: 174.8, "forecast_days": 2},
+        timedelta(minutes=60),
+        transport=_StaticTransport(body),
+    )
+
+    await coordinator.async_refresh()
+
+    daily = coordinator.data["daily"]
+    assert [day["date"] for day in daily] == ["2024-01-01", "2024-01-02"]
+    assert daily[0]["wave_height_max"] == 1.0
+    assert daily[1]["wave_height_min"] == 2.0
+    assert coordinator.today() == daily[1]
+
+
+async def test_unchanged_forecast_with_gaps_summarized_once(hass: HomeAssistant) -> None:
+    """Test a repeated forecast with missing hours is not summarized again."""
+    body = json.dumps(
+        {
+            "timezone": "GMT",
+            "utc_offset_seconds": 0,
+            "current": {"time": "2024-01-01T00:00", "wave_height": 1.0},
+            "hourly": {
+                "time": ["2024-01-01T00:00", "2024-01-01T01:00", "2024-01-01T02:00"],
+                "wave_height": [1.0, None, 2.0],
+            },
+        }
+    ).encode()
+    coordinator = OpenMeteoMarineDataUpdateCoordinator(
+        hass,
+        {CONF_LATITUDE: -33.9, CONF_LONGITUDE: 151.3, "forecast_days": 1},
+        timedelta(minutes=60),
+        transport=_StaticTransport(body),
+    )
+
+    with patch(
+        "custom_components.openmeteo_marine.coordinator.daily_aggregates",
+        wraps=daily_aggregates,
+    ) as aggregate:
+        for _ in range(3):
+            await coordinator.async_refresh()
+
+    assert aggregate.call_count == 1
+    assert coordinator.data["daily"][0]["wave_height_max"] == 2.0
@@ -0,0 +1,92 @@
+"""Test the Open Meteo Marine transports."""
+import json
+
+import httpx
+import pytest
+
+from custom_components.openmeteo_marine.transport import (
+    HttpxTransport,
+    MarineTransport,
+    MarineTransportError,
+    MissingFixtureError,
+    RecordingTransport,
+    ReplayTransport,
+)
+
+PARAMS = {
+    "latitude": -33.8908,
+    "longitude": 151.2743,
+    "current": ["wave_height", "wave_direction"],
+}
+
+
+class StaticTransport(MarineTransport):
+    """Transport always answering with the same body."""
+
+    def __init__(self, body: bytes) -> None:
+        """Initialize."""
+        self.body = body
+
+    async def async_get(self, params):
+        """Return the static body."""
+        return self.body
+
+
+async def test_record_and_replay(tmp_path) -> None:
+    """Test a recorded response is replayed for the same request."""
+    body = b'{"current": {"wave_height": 1.2}}'
+    recorder = RecordingTransport(StaticTransport(body), tmp_path)
+    assert await recorder.async_get(PARAMS) == body
+
+    replay = ReplayTransport(tmp_path)
+    assert await replay.async_get(PARAMS) == body
+    assert replay.bytes_served == len(body)
+
+    with pytest.raises(MissingFixtureError):
+        await replay.async_get({**PARAMS, "latitude": 0.0})
+
+
+async def test_synthesize_multi_location_hourly() -> None:
+    """Test synthesized payloads follow the requested shape."""
+    replay = ReplayTransport(synthesize=True)
+
+    data = json.loads(
+        await replay.async_get(
+            {
+                "latitude": "-33.75,-34.0",
+                "longitude": "151.25,151.5",
+                "hourly": "wave_height",
+                "forecast_days": 2,
+                "timeformat": "unixtime",
+            }
+        )
+    )
+
+    assert len(data) == 2
+    assert len(data[0]["hourly"]["time"]) == 48
+    assert isinstance(data[0]["hourly"]["time"][0], int)
+
+
+async def test_error_injection() -> None:
+    """Test injected errors surface as transport errors."""
+    replay = ReplayTransport(synthesize=True, error_rate=1.0, seed=1)
+
+    with pytest.raises(MarineTransportError):
+        await replay.async_get(PARAMS)
+
+
+async def test_shared_client_uses_transport_timeout() -> None:
+    """Test a shared client gets the transport's timeout, not its own default."""
+    timeouts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        timeouts.append(request.extensions["timeout"]["read"])
+        return httpx.Response(200, content=b"{}")
+
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), timeout=5.0
+    ) as client:
+        transport = HttpxTransport("https://example.invalid/v1/marine", client=client)
+        assert await transport.async_get(PARAMS) == b"{}"
+
+    assert timeouts == [30.0]
@@ -0,0 +1,98 @@
+"""Test the Open Meteo Marine weather entity."""
+import json
+from typing import Any
+
+from homeassistant.const import CONF_LATITUDE, CONF_LONGITUDE
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.openmeteo_marine.const import DOMAIN
+from custom_components.openmeteo_marine.transport import MarineTransport, ReplayTransport
+
+ENTITY_ID = "weather.open_meteo_marine_forecast"
+
+
+class _StaticTransport(MarineTransport):
+    """Answer every request with the current body."""
+
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+
+    async def async_get(self, params: dict[str, Any]) -> bytes:
+        return self.body
+
+
+def _body(wave_heights: list[float | None]) -> bytes:
+    """Return a response with an hourly wave height forecast."""
+    return json.dumps(
+        {
+            "timezone": "GMT",
+            "utc_offset_seconds": 0,
+            "current": {"time": "2024-01-01T00:00", "wave_height": 1.0},
+            "hourly": {
+                "time": [f"2024-01-01T{hour:02d}:00" for hour in range(len(wave_heights))],
+                "wave_height": wave_heights,
+                # Coastal points often have no sea surface temperature
+                "sea_surface_temperature": [None] * len(wave_heights),
+            },
+        }
+    ).encode()
+
+
+async def _setup_entry(
+    hass: HomeAssistant, transport: MarineTransport | None = None
+) -> MockConfigEntry:
+    """Set up a location with a forecast, by default from synthesized responses."""
+    hass.data[DOMAIN] = {"transport": transport or ReplayTransport(synthesize=True)}
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_LATITUDE: -33.9, CONF_LONGITUDE: 151.3, "forecast_days": 2},
+    )
+    entry.add_to_hass(hass)
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+    return entry
+
+
+async def test_forecast_pushed_once_per_change(hass: HomeAssistant) -> None:
+    """Test subscribers only get a forecast when it changed, gaps included."""
+    transport = _StaticTransport(_body([1.0, None, 1.5]))
+    entry = await _setup_entry(hass, transport)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    entity = hass.data["weather"].get_entity(ENTITY_ID)
+    pushed = []
+    unsubscribe = entity.async_subscribe_forecast("hourly", pushed.append)
+
+    for _ in range(3):
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+    assert pushed == []
+    assert coordinator.forecast_revision == 1
+
+    transport.body = _body([1.0, None, 2.0])
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert len(pushed) == 1
+    assert pushed[0][2]["wave_height"] == 2.0
+    assert pushed[0][1]["wave_height"] is None
+
+    unsubscribe()
+
+
+async def test_forecast_fields(hass: HomeAssistant) -> None:
+    """Test forecast rows carry weather forecast fields next to marine values."""
+    await _setup_entry(hass)
+    entity = hass.data["weather"].get_entity(ENTITY_ID)
+
+    hourly = await entity.async_forecast_hourly()
+    assert hourly[0]["native_temperature"] == hourly[0]["sea_surface_temperature"]
+    assert "wave_height" in hourly[0]
+    assert await entity.async_forecast_hourly() is hourly
+
+    daily = await entity.async_forecast_daily()
+    assert daily[0]["native_temperature"] == daily[0]["sea_surface_temperature_max"]
+    assert daily[0]["native_templow"] == daily[0]["sea_surface_temperature_min"]
+
+    state = hass.states.get(ENTITY_ID)
+    assert state.attributes["temperature"] is not None
@@ -86,7 +86,8 @@ def test_component_structure() -> bool:
         "const.py",
         "config_flow.py",
         "coordinator.py",
-        "sensor.py"
+        "sensor.py",
+        "weather.py"
     ]
     
     missing_files = []
@@ -120,7 +121,17 @@ def main():
         "const.py", 
         "config_flow.py",
         "coordinator.py",
-        "sensor.py"
+        "ensemble.py",
+        "forecast.py",
+        "grid.py",
+        "history.py",
+        "parser.py",
+        "profiling.py",
+        "scheduler.py",
+        "sensor.py",
+        "summary.py",
+        "transport.py",
+        "weather.py"
     ]
     
     for file in python_files: